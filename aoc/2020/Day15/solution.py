@@ -1,9 +1,9 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 def is_cycle(seq: List[int]) -> bool:
     for middle in range(1, (len(seq) // 2 + 1)):
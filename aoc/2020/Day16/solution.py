@@ -1,10 +1,10 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 import re
 
-entries, example_entries, example2_entries = parse_all(__file__, "entry.txt", "example.txt", "example2.txt")
+entries, example_entries, example2_entries = lazy_parse_all(__file__, "entry.txt", "example.txt", "example2.txt")
 
 class Range:
     def __init__(self, min: str, max: str):
@@ -1,10 +1,10 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set, Callable
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 from collections import namedtuple
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 def add_point(p1: Tuple, p2: Tuple):
     return tuple(p1[i] + p2[i] for i in range(len(p1)))
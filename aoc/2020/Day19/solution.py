@@ -1,11 +1,11 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 import re
 import abc
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 class BaseRule(abc.ABC):
     def __init__(self, id: int):
@@ -3,6 +3,7 @@ import os
 import copy
 from typing import List, Optional, Tuple
 import numpy as np
+from aoc.common.box import Box, SignedVolumes
 
 entry_file = Path(os.path.abspath(__file__)).parent / "entry.txt"
 example_file = Path(os.path.abspath(__file__)).parent / "example.txt"
@@ -51,52 +52,22 @@ def first_part():
     print("First answer:", np.sum(grid))
 
 # PART 2
-class Cuboid:
-    def __init__(self, x_min, x_max, y_min, y_max, z_min, z_max):
-        self.x_min = x_min
-        self.x_max = x_max
-        self.y_min = y_min
-        self.y_max = y_max
-        self.z_min = z_min
-        self.z_max = z_max
-
-    def intersection(self, other) -> bool:
-        if self.x_max < other.x_min \
-            or other.x_max < self.x_min \
-            or self.y_max < other.y_min \
-            or other.y_max < self.y_min \
-            or self.z_max < other.z_min \
-            or other.z_max < self.z_min:
-            return False
-
-        return True
-
-    def is_in(self, other) -> bool:
-        return self.x_min <= other.x_min and self.x_max >= other.x_max \
-            and self.y_min <= other.y_min and self.y_max >= other.y_max \
-            and self.z_min <= other.z_min and self.z_max >= other.z_max
-
-    def compute_intersection(self, other) -> Optional[ThreeRangeTuple]:
-        if not self.intersection(other):
-            return None
-
-        return (max(self.x_min, other.x_min), min(self.x_max, other.x_max)), \
-               (max(self.y_min, other.y_min), min(self.y_max, other.y_max)), \
-               (max(self.z_min, other.z_min), min(self.z_max, other.z_max))
-
-    def compute_union(self, other) -> List["Cuboid"]:
-        pass
-
-    def can_merge(self, other) -> bool:
-        if not self.intersection(other):
-            return (other.x_min == self.x_max or other.x_max == self.x_min) and \
-                (other.y_min == self.y_max or other.y_max == self.y_min) and \
-                (other.z_min == self.z_max or other.z_max == self.z_min)
-
-        else:
-            pass
-def intersect_cuboid():
-    pass
+def parse_step(entry: str) -> Tuple[Box, bool]:
+    value, rest = entry.split(" ")
+    ranges = []
+    for coordinate in rest.split(","):
+        ranges.append(tuple(int(v) for v in coordinate[2:].split("..")))
+
+    return Box(ranges), value == "on"
+
+def second_part():
+    volumes = SignedVolumes(3)
+    for e in entries:
+        box, on = parse_step(e)
+        volumes.update(box, on)
+
+    print("Second answer:", volumes.volume())
 
 if __name__ == "__main__":
     first_part()
+    second_part()
@@ -8,6 +8,7 @@ import sys
 import itertools
 import time
 import numpy as np
+from aoc.common.parse_cache import cached_parser
 
 entry_file = Path(os.path.abspath(__file__)).parent / "entry.txt"
 example_file = Path(os.path.abspath(__file__)).parent / "example.txt"
@@ -77,6 +78,10 @@ class Node:
         self.neighbors.add(other)
         other.neighbors.add(self)
 
+    # The name is given to the constructor, so the node can be hashed while the cycles of neighbors are unpickled
+    def __reduce__(self):
+        return (Node, (self.name, self.flow_rate), self.__dict__)
+
     def __hash__(self) -> int:
         return hash(self.name)
 
@@ -106,6 +111,7 @@ class Node:
             self.paths_to_others[n] = dijsktra(all_nodes, self, n)
 
 
+@cached_parser
 def parse_input(input: List[str]) -> set[Node]:
     pattern = "Valve ([A-Z]{2}) has flow rate=([0-9]+); tunnel(?:s)? lead(?:s)? to valve(?:s)? (.*)"
     res: set[Node] = set()
@@ -4,6 +4,7 @@ import copy
 from typing import List, Tuple, Dict
 import enum
 from collections import namedtuple
+from aoc.common.cycle import fast_forward
 
 Position = namedtuple("Position", ["x", "y"])
 
@@ -161,6 +162,52 @@ class Block:
         return res
 
 
+class Tower:
+    def __init__(self, entry: str, all_blocks: List[Block]):
+        self.entry = entry
+        self.all_blocks = all_blocks
+        self.grid = Grid(7)
+        self.current_block_index = 0
+        self.current_entry_index = 0
+
+    def drop_block(self) -> "Tower":
+        grid = self.grid
+        entry = self.entry
+        # Spawn a new block
+        current_block = self.all_blocks[self.current_block_index].spawn_block(grid)
+
+        while True:
+            # first try to move it accroding to entry
+            dir = entry[self.current_entry_index]
+            if dir == "<" and not current_block.will_collide(grid, -1, 0):
+                current_block.go_left()
+            elif dir == ">" and not current_block.will_collide(grid, 1, 0):
+                current_block.go_right()
+            self.current_entry_index += 1
+            if self.current_entry_index >= len(entry):
+                self.current_entry_index = 0
+
+            # Then try to move down
+            # If we collide, fix the block and spawn a new block
+            if current_block.will_collide(grid, 0, -1):
+                grid.fix_block(current_block)
+                break
+            current_block.go_down()
+        
+        self.current_block_index += 1
+        if self.current_block_index >= len(self.all_blocks):
+            self.current_block_index = 0
+        return self
+
+    # The grid is cut under the highest blocked line, so the visible part of the grid
+    # with the next block and entry fully determine the rest of the simulation.
+    def fingerprint(self) -> Tuple[int, int, int]:
+        return (hash(self.grid), self.current_block_index, self.current_entry_index)
+
+    def height(self) -> int:
+        return self.grid.current_max_height
+
+
 def simulate(entry: str, max_count: int):
     all_blocks = [
         # @@@@
@@ -183,67 +230,8 @@ def simulate(entry: str, max_count: int):
         Block([Position(0, 1), Position(1, 1), Position(0, 0), Position(1, 0)])
     ]
 
-    grid = Grid(7)
-    current_block_index = 0
-    current_entry_index = 0
-    count = 0
-
-    seen = {}
-    tracking = True
-
-    while count < max_count:
-        # We keep a dict of all the grid we seen, with a given block and entry
-        # to find cycles.
-        temp = (hash(grid), current_block_index, current_entry_index)
-        if temp in seen:
-            # When we find a cycle, we just have to advance the simulation
-            # for as many full cycle we have for the remaining number of steps.
-            diff_count = count - seen[temp][0]
-            diff_height = grid.current_max_height - seen[temp][1]
-
-            remaining = max_count - count
-            todo = remaining // diff_count
-
-            count += todo * diff_count
-            new_height = diff_height * todo
-            grid.current_max_height += new_height
-            grid.height += new_height
-            grid.grid_offset += new_height
-
-            # No need to track seen anymore
-            seen.clear()
-            tracking = False
-
-        if tracking:
-            seen[temp] = (count, grid.current_max_height)
-
-        # Spawn a new block
-        current_block = all_blocks[current_block_index % len(all_blocks)].spawn_block(grid)
-
-        while True:
-            # first try to move it accroding to entry
-            dir = entry[current_entry_index]
-            if dir == "<" and not current_block.will_collide(grid, -1, 0):
-                current_block.go_left()
-            elif dir == ">" and not current_block.will_collide(grid, 1, 0):
-                current_block.go_right()
-            current_entry_index += 1
-            if current_entry_index >= len(entry):
-                current_entry_index = 0
-
-            # Then try to move down
-            # If we collide, fix the block and spawn a new block
-            if current_block.will_collide(grid, 0, -1):
-                grid.fix_block(current_block)
-                break
-            current_block.go_down()
-        
-        current_block_index += 1
-        if current_block_index >= len(all_blocks):
-            current_block_index = 0
-        count += 1
-
-    return grid.current_max_height
+    tower = Tower(entry, all_blocks)
+    return fast_forward(tower, Tower.drop_block, Tower.fingerprint, Tower.height, max_count)
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ from typing import List, Tuple, Any
 import re
 import sys
 import math
-import time
+from aoc.common.utils import profile_scope
 
 entry_file = Path(os.path.abspath(__file__)).parent / "entry.txt"
 example_file = Path(os.path.abspath(__file__)).parent / "example.txt"
@@ -23,17 +23,6 @@ entries = parse_entry(entry_file)
 example_entries = parse_entry(example_file)
 
 
-class Profiling:
-    def __init__(self):
-        self.start = 0
-
-    def __enter__(self):
-        self.start = time.perf_counter()
-
-    def __exit__(self, *args):
-        print(f"Time taken = {(time.perf_counter() - self.start) * 1000:.2f}ms")
-
-
 class Resources:
     def __init__(self, ore: int = 0, clay: int = 0, obsidian: int = 0, geode: int = 0):
         self.ore = ore
@@ -328,11 +317,11 @@ def solve2(entries: List[str], try_other_simulation: bool):
 
 if __name__ == "__main__":
     print("My solution:")
-    with Profiling():
+    with profile_scope("solve"):
         solve(entries, False)
 
     print("Other solution:")
-    with Profiling():
+    with profile_scope("solve_other"):
         solve(entries, True)
 
     solve2(entries)
\ No newline at end of file
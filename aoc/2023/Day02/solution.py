@@ -2,9 +2,9 @@ from __future__ import annotations
 from pathlib import Path
 import os
 from typing import List
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 
 class Draw:
@@ -1,92 +1,27 @@
-from pathlib import Path
-import os
-import copy
+import functools
 from typing import List, Tuple, Dict
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all, parse_array, extract_integers
 from aoc.common.utils import profile
+from aoc.common.range import IntervalSet, OffsetMap
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 
-class Range:
-    def __init__(self, _min: int, _range: int):
-        assert(_range > 0)
-        self.min = _min
-        self.max = _min + _range
-
-    def __contains__(self, x: int):
-        return self.min <= x < self.max
-    
-    def __repr__(self) -> str:
-        return f"[{self.min}; {self.max}]"
-
-
-class SingleMap:
-    def __init__(self, min_dest: int, min_source: int, _range: int):
-        self.dest = Range(min_dest, _range)
-        self.source = Range(min_source, _range)
-
-    def __call__(self, x: int) -> Tuple[int, bool]:
-        if x not in self.source:
-            return x, False
-        
-        offset = x - self.source.min
-        return self.dest.min + offset, True
-    
-    def reverse_call(self, x: int) -> Tuple[int, bool]:
-        if x not in self.dest:
-            return x, False
-        
-        offset = x - self.dest.min
-        return self.source.min + offset, True
-    
-    @staticmethod
-    def construct(entry: str) -> "SingleMap":
-        return SingleMap(*map(int, entry.split()))
-    
-    def __repr__(self) -> str:
-        return f"{self.dest} <- {self.source}"
-    
-
-class Map:
-    def __init__(self, single_maps: List[SingleMap]) -> None:
-        self.single_maps = single_maps
-
-    def __call__(self, x: int) -> int:
-        final_x = x
-        for single_map in self.single_maps:
-            temp, mapped = single_map(x)
-            if mapped:
-                final_x = temp
-                break
-        
-        return final_x
-    
-    def reverse_call(self, x: int) -> int:
-        final_x = x
-        for single_map in self.single_maps:
-            temp, mapped = single_map.reverse_call(x)
-            if mapped:
-                final_x = temp
-                break
-        
-        return final_x
-    
-    @staticmethod
-    def construct(entry: List[str]) -> "Map":
-        return Map([SingleMap.construct(x) for x in entry])
-    
-    def __repr__(self) -> str:
-        return str(self.single_maps)
+# A map is a list of "dest source range" lines: [source, source + range) goes to [dest, dest + range)
+def construct_map(entry: List[str]) -> OffsetMap:
+    res = OffsetMap()
+    for dest, source, _range in parse_array(entry).tolist():
+        res.add(source, source + _range - 1, dest - source)
+    return res
 
 
 class Almanac:
     def __init__(self, entry: List[str]):
-        self.seeds = list(map(int, entry[0][7:].split()))
+        self.seeds = extract_integers(entry[0]).tolist()
 
-        self.seed_ranges = [Range(self.seeds[2 * i], self.seeds[2 * i+1]) for i in range(len(self.seeds) // 2)]
+        self.seed_ranges = IntervalSet((self.seeds[2 * i], self.seeds[2 * i] + self.seeds[2 * i + 1] - 1) for i in range(len(self.seeds) // 2))
 
-        self.maps: Dict[str, Map] = {}
+        self.maps: Dict[str, OffsetMap] = {}
         i = 2
         while i < len(entry):
             map_name = entry[i][:-1]
@@ -95,41 +30,32 @@ class Almanac:
             while i < len(entry) and len(entry[i]) > 0:
                 i += 1
 
-            self.maps[map_name] = Map.construct(entry[start:i])
+            self.maps[map_name] = construct_map(entry[start:i])
             i += 1
 
+        # All the maps composed into a single one, from seed to location
+        self.seed_to_location = functools.reduce(OffsetMap.then, self.maps.values(), OffsetMap())
+
     def __repr__(self) -> str:
         res = f"seeds: {self.seeds}\n"
         for map_name, maps in self.maps.items():
             res += f"{map_name}: {maps}\n"
         return res
     
-    def map_seeds(self) -> List[str]:
-        res = copy.deepcopy(self.seeds)
-        for _map in self.maps.values():
-            for i in range(len(res)):
-                res[i] = _map(res[i])
-
-        return res
+    def map_seeds(self) -> List[int]:
+        return [self.seed_to_location(seed) for seed in self.seeds]
     
-    def reverse(self, x: int) -> bool:
-        temp = x
-        for _map in reversed(self.maps.values()):
-            temp = _map.reverse_call(temp)
-
-        return any([temp in seed for seed in self.seed_ranges])
+    # All the locations of the seed ranges, computed by splitting the ranges, not seed by seed
+    def map_seed_ranges(self) -> IntervalSet:
+        return self.seed_to_location.map_set(self.seed_ranges)
 
 
 def part_one(almanac: Almanac) -> int:
     return min(almanac.map_seeds())
 
-#@profile
+@profile
 def part_two(almanac: Almanac) -> int:
-    location = 1
-    while True:
-        if almanac.reverse(location):
-            return location
-        location += 1
+    return next(iter(almanac.map_seed_ranges())).min
 
 
 if __name__ == "__main__":
@@ -3,9 +3,9 @@ import os
 import copy
 import math
 from typing import List, Tuple, Dict
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 # With x being the time spent pressing the button
 # distance = (time - t) * t
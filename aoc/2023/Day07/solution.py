@@ -3,9 +3,9 @@ import os
 import copy
 from typing import List, Tuple, Dict
 from enum import IntEnum
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 CardMap = {
     '2': 0,
@@ -2,10 +2,10 @@ from pathlib import Path
 import os
 import copy
 from typing import List, Tuple, Dict
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 import numpy as np
 
-entries, example_entries, example2_entries = parse_all(__file__, "entry.txt", "example.txt", "example2.txt")
+entries, example_entries, example2_entries = lazy_parse_all(__file__, "entry.txt", "example.txt", "example2.txt")
 
 class Node:
     def __init__(self, name: str, left: str, right: str):
@@ -2,9 +2,9 @@ from pathlib import Path
 import os
 import copy
 from typing import List, Tuple, Dict
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 
 def part_one_and_two(entry: List[str]) -> int:
@@ -2,12 +2,12 @@ from pathlib import Path
 import os
 import copy
 from typing import List, Tuple, Dict, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from enum import IntEnum, auto
 from aoc.common.point import Point
 from aoc.common.grid import Grid
 
-entries, example_entries, example_entries2, example_entries3, example_entries4 = parse_all(__file__, "entry.txt", "example.txt", "example2.txt", "example3.txt", "example4.txt")
+entries, example_entries, example_entries2, example_entries3, example_entries4 = lazy_parse_all(__file__, "entry.txt", "example.txt", "example2.txt", "example3.txt", "example4.txt")
 
 class Direction(IntEnum):
     Up = 0
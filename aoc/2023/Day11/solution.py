@@ -2,10 +2,10 @@ from pathlib import Path
 import os
 import copy
 from typing import List, Tuple, Dict
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.point import Point
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 class Map:
     def __init__(self, entry: List[str], expansion: int):
@@ -28,17 +28,17 @@ class Map:
         offset = 0
         for i, row in enumerate(rows):
             if not row:
-                for galaxy in self.galaxies:
+                for k, galaxy in enumerate(self.galaxies):
                     if galaxy.x - offset > i:
-                        galaxy.x += expansion
+                        self.galaxies[k] = galaxy + Point(expansion, 0)
                 offset += expansion
 
         offset = 0        
         for j, col in enumerate(cols):
             if not col:
-                for galaxy in self.galaxies:
+                for k, galaxy in enumerate(self.galaxies):
                     if galaxy.y - offset > j:
-                        galaxy.y += expansion
+                        self.galaxies[k] = galaxy + Point(0, expansion)
                 offset += expansion
 
 
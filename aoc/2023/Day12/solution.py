@@ -1,10 +1,10 @@
 from pathlib import Path
 from typing import List, Tuple, Dict
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 from multiprocessing import Pool
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 class State:
     def __init__(self, e: str, damage_list: List[int], damage_count: int):
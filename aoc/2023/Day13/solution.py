@@ -1,8 +1,8 @@
 from typing import List, Tuple, Dict, Optional
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 def convert_to_bitfield(e: str) -> int:
     res = 0
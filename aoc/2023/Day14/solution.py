@@ -1,12 +1,13 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 from aoc.common.grid import Grid
 from aoc.common.point import Point
+from aoc.common.cycle import find_cycle
 from enum import Enum
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 class Direction(Enum):
     North = 0
@@ -73,6 +74,14 @@ class Map(Grid):
                         else:
                             self.grid[x][y] = "."
 
+    def spin(self) -> "Map":
+        for dir in [Direction.North, Direction.West, Direction.South, Direction.East]:
+            self.roll(dir)
+        return self
+
+    def fingerprint(self) -> str:
+        return "".join("".join(line) for line in self.grid)
+
     def load(self):
         res = 0
         for x in range(self.max_x):
@@ -97,26 +106,8 @@ def part_one(entry: List[str]) -> int:
 def part_two(entry: List[str]) -> int:
     entry = [[c for c in e] for e in entry]
     my_map = Map(entry)
-    all_maps = {}
-    i = 0
-    while True:
-        for dir in [Direction.North, Direction.West, Direction.South, Direction.East]:
-            my_map.roll(dir)
-
-        if my_map in all_maps:
-            break
-
-        all_maps[copy.deepcopy(my_map)] = i
-        i += 1
-
-    cycle = i - all_maps[my_map]
-    remaining = (1000000000 - i - 1) % cycle
-
-    for _ in range(remaining):
-        for dir in [Direction.North, Direction.West, Direction.South, Direction.East]:
-            my_map.roll(dir)
-
-    return my_map.load()
+    cycle, _ = find_cycle(my_map, Map.spin, Map.fingerprint, Map.load)
+    return cycle.metric_at(1000000000)
 
 
 if __name__ == "__main__":
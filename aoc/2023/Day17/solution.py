@@ -1,14 +1,15 @@
 import copy
 from typing import Any, List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 from aoc.common.grid import Grid
 from aoc.common.grid import Point
 from aoc.common.direction import *
 from queue import PriorityQueue
-from aoc.common.astar import AStar_Solver
+from aoc.common.astar import BucketAStar
+from aoc.common.grid_astar import GridAStar_Solver
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 
 class State:
@@ -53,7 +54,10 @@ class State:
         return str((self.pos, self.dir, self.straight))
 
 
-class ClumsyCrucible(AStar_Solver):
+class ClumsyCrucible(BucketAStar):
+    # Heat loss is between 1 and 9, and the heuristic varies by 1 for each step
+    nb_buckets = 16
+
     def __init__(self, grid: List[str]):
         super().__init__()
         self.grid = Grid([[int(y) for y in x] for x in grid])
@@ -82,17 +86,57 @@ class ClumsyCrucible(AStar_Solver):
         return sum([self.grid[s.pos] for s in res[1:]])
 
 
+# Same search as ClumsyCrucible (still used by benchmarks/astar_frontiers.py), with int states:
+# the extra dimension is (direction // 2) * max_straight + straight, directions being the 4 even Directions
+class ClumsyCrucibleGrid(GridAStar_Solver):
+    def __init__(self, grid: List[str], min_straight: int, max_straight: int):
+        super().__init__(Grid([[int(y) for y in x] for x in grid]), 4 * max_straight)
+        self.min_straight = min_straight
+        self.max_straight = max_straight
+        self.costs = [self.grid[Point(x, y)] for x in range(self.height) for y in range(self.width)]
+
+    def heuristic(self, index: int) -> int:
+        x, y, _ = self.position(index)
+        return (self.height - 1 - x) + (self.width - 1 - y)
+
+    def get_neighbors(self, index: int) -> List[Tuple[int, int]]:
+        x, y, extra = self.position(index)
+        dir, straight = divmod(extra, self.max_straight)
+        moves = []
+        if straight >= self.min_straight - 1:
+            moves.append(((dir + 1) % 4, 0))
+            moves.append(((dir + 3) % 4, 0))
+        if straight < self.max_straight - 1:
+            moves.append((dir, straight + 1))
+
+        res = []
+        for new_dir, new_straight in moves:
+            incr = dir_to_incr[2 * new_dir]
+            new_x, new_y = x + incr.x, y + incr.y
+            if 0 <= new_x < self.height and 0 <= new_y < self.width:
+                res.append((self.index(new_x, new_y, new_dir * self.max_straight + new_straight), self.costs[self.cell_index(new_x, new_y)]))
+        return res
+
+    def is_end(self, index: int) -> bool:
+        return index // self.nb_extra == self.nb_cells - 1
+
+    def get_start_indexes(self) -> List[int]:
+        return [self.index(0, 0, (dir // 2) * self.max_straight) for dir in (Direction.East, Direction.South)]
+
+    def solve(self) -> int:
+        path = self.solve_indexes()
+        return self.g_score[path[-1]]
+
+
 @profile
 def part_one(entry: List[str]) -> int:
-    graph = ClumsyCrucible(entry)
+    graph = ClumsyCrucibleGrid(entry, 0, 3)
     return graph.solve()
 
 
 @profile
 def part_two(entry: List[str]) -> int:
-    State.min_straight = 4
-    State.max_straight = 10
-    graph = ClumsyCrucible(entry)
+    graph = ClumsyCrucibleGrid(entry, 4, 10)
     return graph.solve()
 
 
@@ -1,12 +1,12 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 from aoc.common.direction import *
 from aoc.common.grid import Grid
 from aoc.common.point import Point
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 class Segment:
     def __init__(self, start: Point, dir: Direction, length: int, color: str):
@@ -64,13 +64,8 @@ def compute_digs(entry: List[str]):
         points.extend(segments[-1].get_all_points())
         curr = points[-1]
 
-    min_point = Point(0, 0)
-    max_point = Point(0, 0)
-
-    min_point.x = min(points, key=lambda p: p.x).x
-    min_point.y = min(points, key=lambda p: p.y).y
-    max_point.x = max(points, key=lambda p: p.x).x
-    max_point.y = max(points, key=lambda p: p.y).y
+    min_point = Point(min(points, key=lambda p: p.x).x, min(points, key=lambda p: p.y).y)
+    max_point = Point(max(points, key=lambda p: p.x).x, max(points, key=lambda p: p.y).y)
 
     return segments, points, min_point, max_point
 
@@ -1,9 +1,9 @@
-import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
+from aoc.common.box import Box
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 class Part:
     def __init__(self, x: int, m: int, a: int, s: int) -> None:
@@ -26,26 +26,11 @@ class Part:
         x, m, a, s = e[1:-1].split(",")
         return Part(int(x[2:]), int(m[2:]), int(a[2:]), int(s[2:]))
     
-class Range:
-    def __init__(self, x, m, s, a) -> None:
-        self.x = x
-        self.m = m
-        self.a = a
-        self.s = s
-
-    def num_combinaisons(self) -> int:
-        x_diff = self.x[1] - self.x[0] + 1
-        m_diff = self.m[1] - self.m[0] + 1
-        a_diff = self.a[1] - self.a[0] + 1
-        s_diff = self.s[1] - self.s[0] + 1
-
-        assert(x_diff > 0 and m_diff > 0 and a_diff > 0 and s_diff > 0)
-
-        return x_diff * m_diff * a_diff * s_diff
+# Box of the x, m, a, s ratings, in this order
+axes = {"x": 0, "m": 1, "a": 2, "s": 3}
 
-    @staticmethod
-    def initial_range() -> "Range":
-        return Range([1, 4000], [1, 4000], [1, 4000], [1, 4000])
+def initial_range() -> Box:
+    return Box([(1, 4000)] * 4)
     
 class Condition:
     def __init__(self, attr: str, less: bool, num: int) -> None:
@@ -62,30 +47,13 @@ class Condition:
             return value > self.num
     
     # First range satisfy condition, second doesn't
-    def split(self, _range: Range) -> Tuple[Optional[Range], Optional[Range]]:
-        value = getattr(_range, self.attr)
+    def split(self, _range: Box) -> Tuple[Optional[Box], Optional[Box]]:
         if self.less:
-            if value[0] >= self.num or value[1] < self.num:
-                return None, _range
-            else:
-                first_range = copy.deepcopy(_range)
-                second_range = copy.deepcopy(_range)
-                setattr(first_range, self.attr, [value[0], self.num - 1])
-                setattr(second_range, self.attr, [self.num, value[1]])
-
-                return first_range, second_range
+            return _range.split(axes[self.attr], self.num)
         else:
-            if value[0] > self.num or value[1] <= self.num:
-                return None, _range
-            else:
-                first_range = copy.deepcopy(_range)
-                second_range = copy.deepcopy(_range)
-                setattr(first_range, self.attr, [value[0], self.num])
-                setattr(second_range, self.attr, [self.num + 1, value[1]])
-
-                return second_range, first_range
+            below, above = _range.split(axes[self.attr], self.num + 1)
+            return above, below
 
-        
     @staticmethod
     def construct(e: str) -> Optional["Condition"]:
         less_split = e.split("<")
@@ -112,7 +80,7 @@ class Workflow:
             
         assert(False)
 
-    def split(self, _range: Range) -> List[Tuple[str, Range]]:
+    def split(self, _range: Box) -> List[Tuple[str, Box]]:
         res = []
         curr = _range
         for condition, workflow in self.conditions_workflow:
@@ -174,7 +142,7 @@ def part_two(entry: List[str]) -> int:
         workflows[workflow.name] = workflow
         i += 1
 
-    ranges = [("in", Range.initial_range())]
+    ranges = [("in", initial_range())]
     valid_ranges = []
     while len(ranges) > 0:
         workflow, _range = ranges.pop()
@@ -186,7 +154,7 @@ def part_two(entry: List[str]) -> int:
 
         ranges.extend(workflows[workflow].split(_range))
 
-    return sum(map(Range.num_combinaisons, valid_ranges))
+    return sum(map(Box.volume, valid_ranges))
 
 
 if __name__ == "__main__":
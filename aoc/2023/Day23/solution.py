@@ -1,12 +1,12 @@
 import copy
 from typing import Any, List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 from aoc.common.grid import Grid
 from aoc.common.point import Point
 from aoc.common.direction import *
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 class Tile:
     def __init__(self, c: str, slip: bool) -> None:
@@ -1,40 +1,44 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
-from aoc.common.point import Point, intersect
+from aoc.common.vector import VectorArray
 import math
+import numpy as np
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
-
-class Hailstone:
-    def __init__(self, initial_pos: Point, velocity: Point):
-        self.initial_pos = initial_pos
-        self.velocity = velocity
-
-    def intersect(self, other: "Hailstone", min_test: int, max_test: int) -> bool:
-        is_intersecting, impact, t, t_ = intersect(self.initial_pos, self.velocity, other.initial_pos, other.velocity)
-        return is_intersecting and t >= 0 and t_ >= 0 and min_test <= impact.x <= max_test and min_test <= impact.y <= max_test
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 @profile
 def part_one(entry: List[str], min_test: int, max_test: int) -> int:
-    hailstones: List[Hailstone] = []
+    positions = []
+    velocities = []
     for e in entry:
         pos, vel = e.split(" @ ")
         pos = pos.split(", ")
         vel = vel.split(", ")
 
-        pos = Point(int(pos[0]), int(pos[1]))
-        vel = Point(int(vel[0]), int(vel[1]))
-        hailstones.append(Hailstone(pos, vel))
+        positions.append((int(pos[0]), int(pos[1])))
+        velocities.append((int(vel[0]), int(vel[1])))
+
+    # All the pairs of hailstones at once
+    i, j = np.triu_indices(len(positions), 1)
+    positions = VectorArray(np.array(positions, dtype=np.int64))
+    velocities = VectorArray(np.array(velocities, dtype=np.int64))
+    a, u = positions[i], velocities[i]
+    b, v = positions[j], velocities[j]
+
+    direction_cross = u.cross_2D(v)
+    # Parallel
+    not_parallel = direction_cross != 0
+    direction_cross = np.where(not_parallel, direction_cross, 1)
 
-    count = 0
-    for i in range(len(hailstones)):
-        for j in range(i + 1, len(hailstones)):
-            if hailstones[i].intersect(hailstones[j], min_test, max_test):
-                count += 1
+    difference = b - a
+    t = difference.cross_2D(v) / direction_cross
+    t_ = difference.cross_2D(u) / direction_cross
+    impact = a + u * t
 
-    return count
+    is_valid = not_parallel & (t >= 0) & (t_ >= 0) & (impact >= min_test) & (impact <= max_test)
+    return int(np.count_nonzero(is_valid))
 
 @profile
 def part_two(entry: List[str]) -> int:
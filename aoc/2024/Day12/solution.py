@@ -1,11 +1,12 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 from aoc.common.grid import Grid
+from aoc.common.disjoint_set import DisjointSet
 from aoc.common.point import Point, up, down, left, right
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 dirs = {up: 0, down: 1, left: 2, right: 3}
 
@@ -23,64 +24,48 @@ class Plant:
 @profile
 def solve(entry: List[str]) -> int:
     grid = Grid([[Plant(entry[i][j], Point(i,j)) for j in range(len(entry[i]))] for i in range(len(entry))])
-    regions: Dict[str, List[List[Plant]]] = {}
 
-    # Flood-fill
-    # While we have unseen positions, pop the first element. It is a new region.
-    # Then for each position, look around. If they are the same name, they are in the same region, so add it to 
-    # the list of positions to check, only if we haven't checked it yet.
-    # Otherwise, if it is outside of the grid or not the same name, it is a boundary, so mark it as boundary.
+    # Union-find on the cell indexes (x * max_y + y): each plant is merged with its neighbors of the same name.
+    # If a neighbor is outside of the grid or not the same name, it is a boundary, so mark it as boundary.
     # The perimeter will be the sum of all the boundaries.
-    unseen_postions = set([Point(i,j) for i in range(grid.max_x) for j in range(grid.max_y)])
-    while len(unseen_postions) > 0:
-        start = unseen_postions.pop()
-        plant_name = grid[start].name
-        if plant_name not in regions:
-            regions[plant_name] = []
-        
-        regions[plant_name].append([])
-        
-        stack = [grid[start]]
-        while len(stack) > 0:
-            curr = stack.pop()
-            regions[plant_name][-1].append(curr)
-            for dir in dirs.keys():
-                temp = curr.pos + dir
-                if grid.is_valid(temp) and grid[temp].name == plant_name:
-                    if temp in unseen_postions:
-                        unseen_postions.remove(temp)
-                        stack.append(grid[temp])
-                else:
-                    curr.add_boundary(dir)
+    disjoint_set = DisjointSet(grid.max_x * grid.max_y)
+    for plant in grid.iterate_row_first():
+        for dir in dirs.keys():
+            temp = plant.pos + dir
+            if grid.is_valid(temp) and grid[temp].name == plant.name:
+                disjoint_set.union(plant.pos.x * grid.max_y + plant.pos.y, temp.x * grid.max_y + temp.y)
+            else:
+                plant.add_boundary(dir)
+
+    regions: List[List[Plant]] = [[grid.get(*divmod(i, grid.max_y)) for i in region] for region in disjoint_set.components().values()]
 
     result_part1 = 0
     result_part2 = 0
-    for rs in regions.values():
-        for r in rs:
-            area = len(r)
-            # To determine all the sides, we do a 1D flood-fill, using the cross with Z up and down to get the perpendicular directions of the boundaries.
-            # We put all the points with a boundary in a set of tuple: (pos, boundary_dir)
-            # We pop the first element, it will be a new side, then we go perpendicular in both directions until we reach the limit, removing the seen elements on the go.
-            unseen_boundaries: Set[Tuple[Point, Point]] = set()
-            side_number = 0
-            for plant in r:
-                for dir in dirs.keys():
-                    if plant.boundaries[dirs[dir]]:
-                        unseen_boundaries.add((plant.pos, dir))
+    for r in regions:
+        area = len(r)
+        # To determine all the sides, we do a 1D flood-fill, using the cross with Z up and down to get the perpendicular directions of the boundaries.
+        # We put all the points with a boundary in a set of tuple: (pos, boundary_dir)
+        # We pop the first element, it will be a new side, then we go perpendicular in both directions until we reach the limit, removing the seen elements on the go.
+        unseen_boundaries: Set[Tuple[Point, Point]] = set()
+        side_number = 0
+        for plant in r:
+            for dir in dirs.keys():
+                if plant.boundaries[dirs[dir]]:
+                    unseen_boundaries.add((plant.pos, dir))
 
-            perimeter = len(unseen_boundaries)
-            result_part1 += area * perimeter
-            
-            while len(unseen_boundaries) > 0:
-                start, dir = unseen_boundaries.pop()
-                side_number += 1
-                for perpendicular_dir in [dir.cross(Point(0, 0, 1)), dir.cross(Point(0, 0, -1))]:
-                    curr = start + perpendicular_dir
-                    while (curr, dir) in unseen_boundaries:
-                        unseen_boundaries.remove((curr, dir))
-                        curr = curr + perpendicular_dir
+        perimeter = len(unseen_boundaries)
+        result_part1 += area * perimeter
+        
+        while len(unseen_boundaries) > 0:
+            start, dir = unseen_boundaries.pop()
+            side_number += 1
+            for perpendicular_dir in [dir.cross(Point(0, 0, 1)), dir.cross(Point(0, 0, -1))]:
+                curr = start + perpendicular_dir
+                while (curr, dir) in unseen_boundaries:
+                    unseen_boundaries.remove((curr, dir))
+                    curr = curr + perpendicular_dir
 
-            result_part2 += area * side_number
+        result_part2 += area * side_number
 
     return result_part1, result_part2
 
@@ -1,18 +1,16 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 from aoc.common.point import Point
 import re
 from functools import reduce
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 def simulate(start: Point, vel: Point, limits: Point, steps: int):
     new_pos = start + vel * steps
-    new_pos.x = new_pos.x % limits.x
-    new_pos.y = new_pos.y % limits.y
-    return new_pos
+    return Point(new_pos.x % limits.x, new_pos.y % limits.y)
 
 def get_all_robots(entry: List[str]):
     regex = re.compile("p=(-?\d+),(-?\d+) v=(-?\d+),(-?\d+)")
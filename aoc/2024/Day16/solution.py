@@ -1,12 +1,12 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
-from aoc.common.astar import AStar_Solver
+from aoc.common.astar import BucketAStar
 from aoc.common.grid import Grid
 from aoc.common.point import Point, up, down, left, right
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 class State:
     def __init__(self, pos: Point, dir: Point, just_turned: bool):
@@ -30,13 +30,23 @@ class State:
         res.append(State(self.pos, self.dir.cross(Point(0, 0, -1)), True))
         
         return res
+
+    def get_previous_states(self, graph: Grid) -> List["State"]:
+        res = []
+        for just_turned in (False, True):
+            if self.just_turned:
+                res.append(State(self.pos, self.dir.cross(Point(0, 0, 1)), just_turned))
+                res.append(State(self.pos, self.dir.cross(Point(0, 0, -1)), just_turned))
+            else:
+                backward = self.pos - self.dir
+                if graph.is_valid(backward) and graph[backward]:
+                    res.append(State(backward, self.dir, just_turned))
+
+        return res
     
     def heuristic(self, end: Point) -> int:
-        goal_dir = end - self.pos
-        if goal_dir.x != 0:
-            goal_dir.x = -1 if goal_dir.x < 0 else 1
-        if goal_dir.y != 0:
-            goal_dir.y = -1 if goal_dir.y < 0 else 1
+        diff = end - self.pos
+        goal_dir = Point((diff.x > 0) - (diff.x < 0), (diff.y > 0) - (diff.y < 0))
 
         nb_turns = self.dir.manathan_distance(goal_dir) % 2
         return self.pos.manathan_distance(end) + nb_turns * 1000
@@ -47,7 +57,10 @@ class State:
     def __repr__(self) -> str:
         return str((self.pos, self.dir, self.just_turned))
 
-class ReindeerMaze(AStar_Solver):
+class ReindeerMaze(BucketAStar):
+    # A turn costs 1000, and can change the heuristic by 1000 too
+    nb_buckets = 2048
+
     def __init__(self, grid: Grid, start_pos: Point, end_pos: Point):
         super().__init__()
         self.grid = grid
@@ -63,6 +76,9 @@ class ReindeerMaze(AStar_Solver):
     def get_neighbors(self, state: State) -> List[State]:
         return state.get_next_states(self.grid)
     
+    def get_predecessors(self, state: State) -> List[State]:
+        return state.get_previous_states(self.grid)
+    
     def is_start(self, state: State) -> bool:
         return state.pos == self.start and state.dir == right and not state.just_turned
     
@@ -72,16 +88,16 @@ class ReindeerMaze(AStar_Solver):
     def get_start_states(self) -> List[State]:
         return [State(self.start, right, False)]
     
+    def get_end_states(self) -> List[State]:
+        return [State(self.end, dir, just_turned) for dir in (up, down, left, right) for just_turned in (False, True)]
+    
     def solve(self, find_all: bool = False) -> int:
-        res = self.solve_internal(find_all)
         if not find_all:
+            res = self.solve_bidirectional()
             return sum([s.get_cost() for s in res[1:]])
         else:
-            unique_pos = set([self.start, self.end])
-            for path in res:
-                for s in path:
-                    unique_pos.add(s.pos)
-            return len(unique_pos)
+            dag = self.solve_internal(True, as_dag=True)
+            return len(set(s.pos for s in dag.nodes()))
 
 @profile
 def part_one(entry: List[str]) -> int:
@@ -1,12 +1,12 @@
 import copy
-from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from typing import Callable, List, Tuple, Dict, Optional, Set
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
-from multiprocessing import Process, Value, Event
-import time
-from ctypes import c_size_t
+from aoc.common.multithread import parallel_search, SearchProgress
+import itertools
+import sys
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 class Interpreter:
     def __init__(self, reg_a: int, reg_b: int, reg_c: int, program: List[int]):
@@ -104,24 +104,26 @@ def part_one(entry: List[str]) -> int:
     interpreter.exec()
     return ",".join([str(i) for i in interpreter.output])
 
-def process(nb_threads: int, index: int, reg_b: int, reg_c: int, program: List[int], stop: Event, result, track):
-    reg_a = index
-    while True:
-        interpreter = Interpreter(reg_a, reg_b, reg_c, program)
-        if interpreter.exec(True) and interpreter.output == program:
-            with result.get_lock():
-                if result.value == 0 or reg_a < result.value:
-                    result.value = reg_a
-            stop.set()
-            break
-        
-        reg_a += nb_threads
+# True if the program outputs itself when register A starts at reg_a
+class OutputsItself:
+    def __init__(self, reg_b: int, reg_c: int, program: List[int]):
+        self.reg_b = reg_b
+        self.reg_c = reg_c
+        self.program = program
+
+    def __call__(self, reg_a: int) -> bool:
+        interpreter = Interpreter(reg_a, self.reg_b, self.reg_c, self.program)
+        return interpreter.exec(True) and interpreter.output == self.program
+
+# Tries all the values of A, only usable on the example (run with --brute-force)
+@profile
+def part_two_brute_force(entry: List[str], progress: Optional[Callable[[SearchProgress], None]] = None) -> int:
+    reg_b = int(entry[1].split(": ")[1])
+    reg_c = int(entry[2].split(": ")[1])
+    p = entry[4].split(": ")[1]
+    program = [int(c) for c in p.split(",")]
 
-        if reg_a % 1000000 == 0:
-            if stop.is_set():
-                break
-            if track is not None:
-                track.value = reg_a
+    return parallel_search(OutputsItself(reg_b, reg_c, program), itertools.count(), block_size=10000, progress=progress)
 
 @profile
 def part_two(entry: List[str]) -> int:
@@ -175,3 +177,6 @@ if __name__ == "__main__":
 
     print("Part 2 example:", part_two(example_entries))
     print("Part 2 entry:", part_two(entries))
+
+    if "--brute-force" in sys.argv:
+        print("Part 2 example (brute force):", part_two_brute_force(example_entries, progress=print))
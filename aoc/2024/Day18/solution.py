@@ -1,12 +1,12 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 from aoc.common.grid import Grid
 from aoc.common.point import Point, up, down, left, right
 from aoc.common.astar import AStar_Solver
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 class CorruptedBytes(AStar_Solver):
     def __init__(self, corrupted: Set[Point], start_pos: Point, end_pos: Point):
@@ -30,6 +30,10 @@ class CorruptedBytes(AStar_Solver):
             res.append(temp)
         return res
     
+    # Moves are reversible and all cost the same
+    def get_predecessors(self, state: Point) -> List[Point]:
+        return self.get_neighbors(state)
+    
     def is_start(self, state: Point) -> bool:
         return state == self.start
     
@@ -39,6 +43,9 @@ class CorruptedBytes(AStar_Solver):
     def get_start_states(self) -> List[Point]:
         return [self.start]
     
+    def get_end_states(self) -> List[Point]:
+        return [self.end]
+    
 def print_grid(corrupted: Set[Point], end: Point, path: Set[Point]):
     res = ""
     for i in range(end.x+1):
@@ -60,34 +67,32 @@ def solve(entry: List[str], start: int) -> int:
     end_pos = Point(0, 0)
 
     def add_corrupted(line: str):
+        nonlocal end_pos
         y, x = line.split(",")
         new_byte = Point(int(x), int(y))
         corrupted_bytes.add(new_byte)
         all_bytes.append(new_byte)
-        if new_byte.x > end_pos.x:
-            end_pos.x = new_byte.x
-        if new_byte.y > end_pos.y:
-            end_pos.y = new_byte.y
+        end_pos = Point(max(end_pos.x, new_byte.x), max(end_pos.y, new_byte.y))
     
     for line in entry[:start]:
         add_corrupted(line)
 
     start_pos = Point(0, 0)
     i = start
-    previous_end_pos = copy.deepcopy(end_pos)
-    previous_path = set(CorruptedBytes(corrupted_bytes, start_pos, end_pos).solve())
+    previous_end_pos = end_pos
+    previous_path = set(CorruptedBytes(corrupted_bytes, start_pos, end_pos).solve(bidirectional=True))
     res_part1 = len(previous_path) - 1
     while True:
         add_corrupted(entry[i])
         # Only need to re-run the algorithm if the new byte cuts our shortest path (or the end pos changed, which change the size of the grid)
         if all_bytes[i] in previous_path or previous_end_pos != end_pos:
-            new_path = CorruptedBytes(corrupted_bytes, start_pos, end_pos).solve()
+            new_path = CorruptedBytes(corrupted_bytes, start_pos, end_pos).solve(bidirectional=True)
 
             if len(new_path) == 0:
                 break
 
             previous_path = set(new_path)
-            previous_end_pos = copy.deepcopy(end_pos)
+            previous_end_pos = end_pos
 
         i += 1
     
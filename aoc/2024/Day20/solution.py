@@ -1,12 +1,12 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set, Any
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 from aoc.common.astar import AStar_Solver, PriorityQueue, StatePriority
 from aoc.common.grid import Grid
 from aoc.common.point import Point, up, left, right, down
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 dirs = [up, left, right, down]
 
@@ -31,6 +31,10 @@ class ProgramRace(AStar_Solver):
                 res.append(temp)
         return res
     
+    # Moves are reversible and all cost the same
+    def get_predecessors(self, state: Point) -> List[Point]:
+        return self.get_neighbors(state)
+    
     def is_start(self, state: Point) -> bool:
         return state == self.start
     
@@ -39,6 +43,9 @@ class ProgramRace(AStar_Solver):
     
     def get_start_states(self) -> List[Point]:
         return [self.start]
+    
+    def get_end_states(self) -> List[Point]:
+        return [self.end]
 
 @profile
 def solve(entry: List[str], threshold: int, cheat_length: int) -> int:
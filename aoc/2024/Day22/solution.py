@@ -1,10 +1,11 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all, extract_integers
 from aoc.common.utils import profile
-from aoc.common.multithread import execute_async
+from aoc.common.multithread import get_pool
+import numpy as np
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 def prune(v :int) -> int:
     return v % 16777216
@@ -72,42 +73,40 @@ def solve(entry: List[str]) -> int:
 
     return count, best_seq, max
 
-def compute_secret(v: int) -> List[int]:
+# A sequence of 4 price changes (each in [-9, 9]) encoded as a base 19 number, to index a dense array
+nb_sequences = 19 ** 4
+
+def encode_sequences(differences: np.ndarray) -> np.ndarray:
+    d = differences + 9
+    return ((d[:-3] * 19 + d[1:-2]) * 19 + d[2:-1]) * 19 + d[3:]
+
+# Partial aggregate of a worker: total price of each encoded sequence, and the sum of the final secrets
+def add_buyer(acc: Tuple[np.ndarray, int], v: int) -> Tuple[np.ndarray, int]:
+    total_prices, total_secrets = acc
     prices = [v % 10]
-    differences = []
-    seq_values = {}
     for _ in range(2000):
         v = next_secret(v)
         prices.append(v % 10)
-        differences.append(prices[-1] - prices[-2])
-        if len(differences) >= 4:
-            seq = (differences[-4], differences[-3], differences[-2], differences[-1])
-            if seq not in seq_values:
-                seq_values[seq] = prices[-1]
-    
-    return seq_values, v
-
-seq_values = {}
-
-def compute_all_sequences(seq: Tuple[int,int,int,int]) -> int:
-    global seq_values
-    sum_price = 0
-    for seq_value in seq_values:
-        if seq in seq_value:
-            sum_price += seq_value[seq]
-    return sum_price
+
+    prices = np.array(prices, dtype=np.int64)
+    sequences = encode_sequences(np.diff(prices))
+    # Only the first time a sequence appears counts
+    sequences, first_index = np.unique(sequences, return_index=True)
+    total_prices[sequences] += prices[first_index + 4]
+    return total_prices, total_secrets + v
+
+def new_aggregate() -> Tuple[np.ndarray, int]:
+    return np.zeros(nb_sequences, dtype=np.int64), 0
+
+def merge(a: Tuple[np.ndarray, int], b: Tuple[np.ndarray, int]) -> Tuple[np.ndarray, int]:
+    return a[0] + b[0], a[1] + b[1]
 
 @profile
 def solve_multithread(entry: List[str]) -> int:
-    global seq_values
     nb_threads = 16
-    seq_values, final_secrets = zip(*execute_async(nb_threads, compute_secret, [int(e) for e in entry]))
-
-    all_possible_sequences = set()
-    for seq_value in seq_values:
-        all_possible_sequences.update(seq_value.keys())
+    total_prices, total_secrets = get_pool(nb_threads).fold_shards(add_buyer, extract_integers(entry).tolist(), new_aggregate, merge)
 
-    return sum(final_secrets), execute_async(nb_threads, compute_all_sequences, all_possible_sequences, max)
+    return total_secrets, int(total_prices.max())
 
 
 if __name__ == "__main__":
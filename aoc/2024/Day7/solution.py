@@ -1,9 +1,9 @@
 from typing import List, Tuple
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 from aoc.common.multithread import MultiWrapper, execute_async
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 def concat(left: int, right: int) -> int:
     return int(str(left) + str(right))
@@ -1,10 +1,10 @@
 from typing import List, Dict, Callable
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 from aoc.common.grid import Point, Grid
 
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 
 def get_antipods(a: Point, b: Point, grid: Grid) -> List[Point]:
@@ -1,6 +1,6 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set, Any
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 import re
 from aoc.common.astar import AStar_Solver
@@ -9,7 +9,7 @@ import numpy as np
 import scipy
 from scipy.optimize import LinearConstraint
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 target_regex = re.compile(r"\[([\.#]+)\]")
 buttons_regex = re.compile(r"\(((?:\d,?)*)\)")
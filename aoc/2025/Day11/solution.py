@@ -1,9 +1,9 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 
-entries, example_entries, example_entries2 = parse_all(__file__, "entry.txt", "example.txt", "example2.txt")
+entries, example_entries, example_entries2 = lazy_parse_all(__file__, "entry.txt", "example.txt", "example2.txt")
 
 def recurse(start: str, end: str, transitions: Dict[str, List[str]], known: Dict[str, int]):
     if start == end:
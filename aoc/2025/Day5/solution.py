@@ -1,10 +1,10 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
-from aoc.common.range import Range
+from aoc.common.range import IntervalSet
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 @profile
 def part_one(entry: List[str]) -> int:
@@ -13,18 +13,10 @@ def part_one(entry: List[str]) -> int:
             cut = i
             break
 
-    ranges = Range.reduce([Range(*map(int, e.split("-"))) for e in entry[:cut]], inclusive=True)
-    
-    count = 0
-    for id in entry[cut+1:]:
-        id = int(id)
-        for r in ranges:
-            if r.min > id:
-                break
+    ranges = IntervalSet(tuple(map(int, e.split("-"))) for e in entry[:cut])
+    ids = [int(id) for id in entry[cut+1:]]
 
-            if r.contains(id, inclusive=True):
-                count += 1
-    return count
+    return int(ranges.contains_batch(ids).sum())
 
 @profile
 def part_two(entry: List[str]) -> int:
@@ -33,12 +25,8 @@ def part_two(entry: List[str]) -> int:
             cut = i
             break
 
-    count = 0
-    ranges = Range.reduce([Range(*map(int, e.split("-"))) for e in entry[:cut]], inclusive=True)
-    for r in ranges:
-        count += (r.max - r.min + 1)
-
-    return count
+    ranges = IntervalSet(tuple(map(int, e.split("-"))) for e in entry[:cut])
+    return ranges.total_length()
 
 if __name__ == "__main__":
     print("Part 1 example:", part_one(example_entries))
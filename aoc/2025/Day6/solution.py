@@ -1,10 +1,10 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all
 from aoc.common.utils import profile
 import re
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt", should_strip=False)
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt", should_strip=False)
 
 @profile
 def part_one(entry: List[str]) -> int:
@@ -1,64 +1,34 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all, parse_array
 from aoc.common.utils import profile
-from aoc.common.point import Point
+from aoc.common.spatial import closest_pairs
+from aoc.common.disjoint_set import DisjointSet
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 @profile
 def solve(entry: List[str], nb_connections:int) -> int:
-    junction_boxes: List[Point] = []
-    circuits: List[Set[Point]] = []
-    mapping: Dict[Point, Set[Point]] = {}
-    for e in entry:
-        p = Point(*map(int, e.split(",")))
-        junction_boxes.append(p)
-        
-        mapping[p] = {p}
-        circuits.append(mapping[p])
-    
-    pairs: List[Tuple[Point, Point, float]] = []
-    for i in range(len(junction_boxes)):
-        left = junction_boxes[i]
-        for j in range(i+1, len(junction_boxes)):
-            right = junction_boxes[j]
-
-            pairs.append((left, right, left.squared_distance(right)))
-
-    pairs = sorted(pairs, key=lambda x: x[2])
+    junction_boxes = parse_array(entry)
+    circuits = DisjointSet(len(junction_boxes))
+    pairs = closest_pairs(junction_boxes)
     
     i = 0
     while True:
         # Part 1 Stop
         if i == nb_connections:
-            while True:
-                try:
-                    circuits.remove(set())
-                except ValueError:
-                    break
-
-            circuits.sort(key=lambda x: len(x), reverse=True)
-
-            part_1 = len(circuits[0]) * len(circuits[1]) * len(circuits[2])
+            biggest = circuits.largest_sizes(3)
+            part_1 = biggest[0] * biggest[1] * biggest[2]
 
         # Part 2 Stop
-        if len(mapping[left]) == len(junction_boxes):
-            part_2 = left.x * right.x
+        if circuits.nb_components == 1:
+            part_2 = int(junction_boxes[left, 0] * junction_boxes[right, 0])
             break
         
-        left, right, _ = pairs[i]
+        left, right, _ = next(pairs)
         i += 1
 
-        if right in mapping[left]:
-            continue
-
-        mapping[left].update(mapping[right])
-        to_update = list(mapping[right])
-        mapping[right].clear()
-        for item in to_update:
-            mapping[item] = mapping[left]
-
+        circuits.union(left, right)
 
     return part_1, part_2
 
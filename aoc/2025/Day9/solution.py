@@ -1,11 +1,11 @@
 import copy
 import math
 from typing import List, Tuple
-from aoc.common.parse_entry import parse_all
+from aoc.common.parse_entry import lazy_parse_all, parse_array
 from aoc.common.utils import profile
 from aoc.common.point import Point2D, intersect_seg
 
-entries, example_entries = parse_all(__file__, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all(__file__, "entry.txt", "example.txt")
 
 def is_on_segment(seg: Tuple[Point2D, Point2D], p: Point2D) -> bool:
     min_x = min(seg[0].x, seg[1].x)
@@ -59,7 +59,7 @@ def is_rect_inside_polygon(polygon: List[Tuple[Point2D, Point2D]], t1: Point2D,
 
 @profile
 def solve(entry: List[str]) -> int:
-    vertices = [Point2D(*map(int, e.split(","))) for e in entry]
+    vertices = [Point2D(x, y) for x, y in parse_array(entry).tolist()]
     polygon = [(vertices[i], vertices[(i+1)%len(vertices)]) for i in range(len(vertices))]
 
     min_x, min_y, max_x, max_y = 0, 0, 0, 0
@@ -1,6 +1,9 @@
 from queue import PriorityQueue
+from enum import IntEnum
 import abc
-from typing import List, Any, Dict
+import heapq
+import itertools
+from typing import List, Any, Dict, Optional, Tuple, Set
 
 class StatePriority:
     def __init__(self, state: Any, priority: int):
@@ -10,15 +13,204 @@ class StatePriority:
     def __lt__(self, other: "StatePriority") -> bool:
         return self.priority < other.priority
 
+
+class FrontierType(IntEnum):
+    # Legacy queue.PriorityQueue of StatePriority. Thread safe, but takes a lock on every put/get.
+    PriorityQueue = 0,
+    # Plain heapq of (priority, tie_breaker, g_score, state) tuples. States are never compared.
+    Heap = 1,
+    # Same as Heap, but entries that were pushed with a worse g_score than the current best one
+    # for their state are skipped when popped (lazy deletion, instead of a decrease-key).
+    LazyHeap = 2,
+    # Circular array of buckets indexed by priority (Dial's algorithm). O(1) push/pop, but only
+    # works with integer priorities, and is best suited for small and bounded edge costs.
+    Bucket = 3
+
+
+# Open set of the A* search. Each entry remembers the g_score the state had when it was pushed.
+class Frontier(abc.ABC):
+    @abc.abstractmethod
+    def push(self, state: Any, priority: int, g_score: int) -> None:
+        pass
+
+    # Returns the state and the g_score it was pushed with.
+    @abc.abstractmethod
+    def pop(self) -> Tuple[Any, int]:
+        pass
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class PriorityQueueFrontier(Frontier):
+    def __init__(self):
+        self.queue = PriorityQueue()
+
+    def push(self, state: Any, priority: int, g_score: int) -> None:
+        self.queue.put(StatePriority((state, g_score), priority))
+
+    def pop(self) -> Tuple[Any, int]:
+        return self.queue.get().state
+
+    def __len__(self) -> int:
+        return self.queue.qsize()
+
+
+class HeapFrontier(Frontier):
+    def __init__(self):
+        self.heap: List[Tuple[int, int, int, Any]] = []
+        # Insertion order is used as a tie breaker, so states never need to be comparable.
+        self.counter = itertools.count()
+
+    def push(self, state: Any, priority: int, g_score: int) -> None:
+        heapq.heappush(self.heap, (priority, next(self.counter), g_score, state))
+
+    def pop(self) -> Tuple[Any, int]:
+        _, _, g_score, state = heapq.heappop(self.heap)
+        return state, g_score
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class LazyHeapFrontier(HeapFrontier):
+    def __init__(self, g_score: Dict[Any, int]):
+        super().__init__()
+        self.g_score = g_score
+
+    # Drop the stale entries on top of the heap, so that len() == 0 really means empty.
+    def discard_stale(self) -> None:
+        while len(self.heap) > 0:
+            _, _, g_score, state = self.heap[0]
+            if g_score <= self.g_score[state]:
+                return
+            heapq.heappop(self.heap)
+
+    def pop(self) -> Tuple[Any, int]:
+        self.discard_stale()
+        return super().pop()
+
+    def __len__(self) -> int:
+        self.discard_stale()
+        return len(self.heap)
+
+
+class BucketFrontier(Frontier):
+    # nb_buckets must be greater than the biggest difference between two priorities
+    # living in the frontier at the same time (roughly max edge cost + heuristic variation).
+    # If it is too small, the buckets are re-allocated.
+    def __init__(self, nb_buckets: int = 64):
+        self.buckets: List[List[Tuple[Any, int]]] = [[] for _ in range(nb_buckets)]
+        self.size = 0
+        # Lowest and highest priorities that can be in the frontier
+        self.min_priority = None
+        self.max_priority = None
+
+    def grow(self, nb_buckets: int) -> None:
+        old_buckets = self.buckets
+        old_min = self.min_priority
+        self.buckets = [[] for _ in range(nb_buckets)]
+        for i in range(len(old_buckets)):
+            priority = old_min + i
+            self.buckets[priority % nb_buckets] = old_buckets[priority % len(old_buckets)]
+
+    def push(self, state: Any, priority: int, g_score: int) -> None:
+        if self.size == 0:
+            self.min_priority = priority
+            self.max_priority = priority
+        else:
+            new_min = min(self.min_priority, priority)
+            new_max = max(self.max_priority, priority)
+            if new_max - new_min >= len(self.buckets):
+                nb_buckets = len(self.buckets)
+                while new_max - new_min >= nb_buckets:
+                    nb_buckets *= 2
+                self.grow(nb_buckets)
+            self.min_priority = new_min
+            self.max_priority = new_max
+
+        self.buckets[priority % len(self.buckets)].append((state, g_score))
+        self.size += 1
+
+    def pop(self) -> Tuple[Any, int]:
+        bucket = self.buckets[self.min_priority % len(self.buckets)]
+        while len(bucket) == 0:
+            self.min_priority += 1
+            bucket = self.buckets[self.min_priority % len(self.buckets)]
+        self.size -= 1
+        return bucket.pop()
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def create_frontier(frontier_type: FrontierType, g_score: Dict[Any, int]) -> Frontier:
+    if frontier_type == FrontierType.PriorityQueue:
+        return PriorityQueueFrontier()
+    elif frontier_type == FrontierType.Heap:
+        return HeapFrontier()
+    elif frontier_type == FrontierType.LazyHeap:
+        return LazyHeapFrontier(g_score)
+    elif frontier_type == FrontierType.Bucket:
+        return BucketFrontier()
+    else:
+        assert(False)
+
+# All the shortest paths found by AStar_Solver.solve_internal(find_all=True, as_dag=True), stored as
+# the graph of optimal predecessors instead of the explicit list of paths (which can be exponential).
+# Costs must be strictly positive, so that the graph has no cycle and g_score is a topological order.
+class ShortestPathsDAG:
+    def __init__(self, came_from: Dict[Any, List[Any]], g_score: Dict[Any, int], end_states: Set[Any]):
+        self.came_from = came_from
+        self.g_score = g_score
+        self.end_states = end_states
+
+    # All states that are on at least one shortest path, sorted by increasing g_score.
+    def nodes(self) -> List[Any]:
+        visited = set(self.end_states)
+        stack = list(self.end_states)
+        while len(stack) > 0:
+            curr = stack.pop()
+            for s in self.came_from.get(curr, []):
+                if s not in visited:
+                    visited.add(s)
+                    stack.append(s)
+
+        return sorted(visited, key=lambda s: self.g_score[s])
+
+    # Number of distinct shortest paths, without enumerating them.
+    def count_paths(self) -> int:
+        nb_paths: Dict[Any, int] = {}
+        for s in self.nodes():
+            if s not in self.came_from:
+                # Start state
+                nb_paths[s] = 1
+            else:
+                nb_paths[s] = sum(nb_paths[p] for p in self.came_from[s])
+
+        return sum(nb_paths[s] for s in self.end_states)
+
+    def __len__(self) -> int:
+        return len(self.nodes())
+
+
 # A* solver.
 # Nodes needs to support == and be hashable.
 # Returns a list of nodes with smallest cost
 # By default, A* heuristic is returning 0, which is the equivalent of the Djikstra algorithm,
 # but you can re-implement it. Be careful to always have an heuristic that NEVER OVERESTIMATES the real cost.
 # Needs to implement a few methods to adapt it to your problem. Start and end states will probably be stored in your __init__ function.
+# The open set backend can be selected per solver, either by overriding frontier_type in the subclass
+# or by passing it to the constructor (see FrontierType).
 class AStar_Solver(abc.ABC):
-    def __init__(self):
-        pass
+    frontier_type: FrontierType = FrontierType.Heap
+
+    def __init__(self, frontier_type: Optional[FrontierType] = None):
+        if frontier_type is not None:
+            self.frontier_type = frontier_type
+        # Number of states expanded (get_neighbors called) by the last solve_internal call
+        self.nb_expanded = 0
 
     def heuristic(self, state: Any) -> int:
         return 0
@@ -43,19 +235,135 @@ class AStar_Solver(abc.ABC):
     def get_start_states(self) -> List[Any]:
         pass
 
+    # Optional hooks for the bidirectional search. get_predecessors must return all the states
+    # that have the given state in their neighbors, and get_end_states all the states where is_end is True.
+    def get_predecessors(self, state: Any) -> List[Any]:
+        raise NotImplementedError()
+
+    def get_end_states(self) -> List[Any]:
+        raise NotImplementedError()
+
+    def supports_bidirectional(self) -> bool:
+        return type(self).get_predecessors is not AStar_Solver.get_predecessors \
+            and type(self).get_end_states is not AStar_Solver.get_end_states
+
+    # Can re-implement this function to tune the frontier (see BucketAStar)
+    def create_frontier(self, g_score: Dict[Any, int]) -> Frontier:
+        return create_frontier(self.frontier_type, g_score)
+
     # Can re-implement this function if we want to do some pre-processing/post-processing
-    def solve(self) -> Any:
+    def solve(self, bidirectional: bool = False) -> Any:
+        if bidirectional:
+            return self.solve_bidirectional()
         return self.solve_internal()
 
-    def solve_internal(self, find_all: bool = False) -> List[Any]:     
-        states = PriorityQueue()
+    # Bidirectional Dijkstra: search forward from the start states and backward from the end states,
+    # and stop when the two searches meet with a path that can't be improved anymore.
+    # The heuristic is not used. Returns a single shortest path, like solve_internal(find_all=False).
+    # Falls back to solve_internal if get_predecessors/get_end_states are not implemented.
+    def solve_bidirectional(self) -> List[Any]:
+        if not self.supports_bidirectional():
+            return self.solve_internal()
+
         start_states = self.get_start_states()
+        end_states = self.get_end_states()
+        # Index 0 is the forward search, index 1 the backward search.
+        # links[0] maps a state to its predecessor, links[1] maps a state to its successor.
+        g_scores: Tuple[Dict[Any, int], Dict[Any, int]] = ({s: 0 for s in start_states}, {s: 0 for s in end_states})
+        links: Tuple[Dict[Any, Any], Dict[Any, Any]] = ({}, {})
+        closed = (set(), set())
+        frontiers = (self.create_frontier(g_scores[0]), self.create_frontier(g_scores[1]))
         for s in start_states:
-            states.put(StatePriority(s, self.heuristic(s)))
+            frontiers[0].push(s, 0, 0)
+        for s in end_states:
+            frontiers[1].push(s, 0, 0)
+
+        self.nb_expanded = 0
+        best_score = None
+        meeting_state = None
+        for s in start_states:
+            if s in g_scores[1]:
+                best_score = 0
+                meeting_state = s
+
+        last_popped = [0, 0]
+        while len(frontiers[0]) > 0 or len(frontiers[1]) > 0:
+            # Expand the smallest frontier first
+            if len(frontiers[1]) == 0 or (len(frontiers[0]) > 0 and len(frontiers[0]) <= len(frontiers[1])):
+                direction = 0
+            else:
+                direction = 1
+
+            # If one side is exhausted without meeting the other one, there is no path.
+            if best_score is None and (len(frontiers[0]) == 0 or len(frontiers[1]) == 0):
+                break
+
+            state, state_gscore = frontiers[direction].pop()
+            if state_gscore > g_scores[direction][state] or state in closed[direction]:
+                continue
 
+            # Scores are popped in increasing order on both sides, so any path that
+            # is not found yet costs at least the sum of the last popped scores.
+            last_popped[direction] = state_gscore
+            if best_score is not None and last_popped[0] + last_popped[1] >= best_score:
+                break
+
+            closed[direction].add(state)
+            self.nb_expanded += 1
+            if direction == 0:
+                next_states = [(s, self.get_cost(s)) for s in self.get_neighbors(state)]
+            else:
+                cost = self.get_cost(state)
+                next_states = [(s, cost) for s in self.get_predecessors(state)]
+
+            g_score = g_scores[direction]
+            other_g_score = g_scores[1 - direction]
+            for s, cost in next_states:
+                tentative_gscore = state_gscore + cost
+                if s in g_score and tentative_gscore >= g_score[s]:
+                    continue
+
+                g_score[s] = tentative_gscore
+                links[direction][s] = state
+                closed[direction].discard(s)
+                frontiers[direction].push(s, tentative_gscore, tentative_gscore)
+
+                if s in other_g_score and (best_score is None or tentative_gscore + other_g_score[s] < best_score):
+                    best_score = tentative_gscore + other_g_score[s]
+                    meeting_state = s
+
+        if best_score is None:
+            # Failed
+            return []
+
+        res = []
+        curr = meeting_state
+        while curr in links[0]:
+            curr = links[0][curr]
+            res.append(curr)
+        res = res[::-1] + [meeting_state]
+        curr = meeting_state
+        while curr in links[1]:
+            curr = links[1][curr]
+            res.append(curr)
+        return res
+
+    # With find_all, returns all the shortest paths (from end to start, start state excluded),
+    # or the ShortestPathsDAG if as_dag is True (as_dag is ignored without find_all).
+    def solve_internal(self, find_all: bool = False, as_dag: bool = False) -> Any:
+        start_states = self.get_start_states()
         came_from: Dict[Any, Any] = {}
         g_score: Dict[Any, int] = {s: 0 for s in start_states}
 
+        states = self.create_frontier(g_score)
+        for s in start_states:
+            states.push(s, self.heuristic(s), 0)
+
+        # States already expanded with their current g_score. A state is only re-opened
+        # if a strictly better path to it is found later on.
+        closed = set()
+        self.nb_expanded = 0
+
         min_score = None
         end_states = set()
 
@@ -81,8 +389,17 @@ class AStar_Solver(abc.ABC):
 
             return res
 
-        while states.qsize() > 0:
-            state = states.get().state
+        while len(states) > 0:
+            state, state_gscore = states.pop()
+            # Stale entry: a better path to this state was found after it was pushed
+            if state_gscore > g_score[state]:
+                continue
+            # Same state pushed several times with the same score: only expand it once
+            if state in closed:
+                continue
+            if min_score is not None and state_gscore > min_score:
+                continue
+
             if self.is_end(state):
                 end_states.add(state)
                 if min_score is None:
@@ -92,7 +409,9 @@ class AStar_Solver(abc.ABC):
                     else:
                         min_score = sum([self.get_cost(s) for s in min_path[1:]])
                     continue
-            
+
+            closed.add(state)
+            self.nb_expanded += 1
             for s in self.get_neighbors(state):
                 tentative_gscore = g_score[state] + self.get_cost(s)
                 if min_score is not None and tentative_gscore > min_score:
@@ -101,13 +420,34 @@ class AStar_Solver(abc.ABC):
                 if s not in g_score or tentative_gscore < g_score[s]:
                     came_from[s] = [state]
                     g_score[s] = tentative_gscore
-                    states.put(StatePriority(s, tentative_gscore + self.heuristic(s)))
+                    closed.discard(s)
+                    states.push(s, tentative_gscore + self.heuristic(s), tentative_gscore)
                 elif find_all and tentative_gscore == g_score[s] and state not in came_from[s]:
+                    # No need to push it again: came_from links states, not paths, so the new
+                    # predecessor is enough. The state is either still in the frontier with this score,
+                    # or was already expanded with it.
                     came_from[s].append(state)
-                    states.put(StatePriority(s, tentative_gscore + self.heuristic(s)))
+
+        if find_all and as_dag:
+            return ShortestPathsDAG(came_from, g_score, end_states)
 
         if min_score is not None:
             return reconstruct_all_paths()
 
         # Failed
         return []
+
+
+
+# Same as AStar_Solver, but uses a bucket queue (Dial's algorithm) instead of a binary heap.
+# Costs and heuristic MUST be integers. Works best when the costs are small and bounded,
+# set nb_buckets to something greater than max cost + max heuristic variation along an edge
+# to avoid re-allocations.
+class BucketAStar(AStar_Solver):
+    frontier_type: FrontierType = FrontierType.Bucket
+    nb_buckets: int = 64
+
+    def create_frontier(self, g_score: Dict[Any, int]) -> Frontier:
+        if self.frontier_type == FrontierType.Bucket:
+            return BucketFrontier(self.nb_buckets)
+        return super().create_frontier(g_score)
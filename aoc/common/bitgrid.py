@@ -0,0 +1,218 @@
+from typing import List, Any, Optional, Callable
+from aoc.common.bitset import BitSet
+from aoc.common.grid import Grid
+from aoc.common.point import Point
+
+# Grid of booleans where each row is stored as a Python int (bit y of row x is the cell (x, y)).
+# All the operations (shifts, and/or/xor, neighbor counts) work on whole rows at once,
+# which is a lot faster than looping over cells for cellular automatons and occupancy grids.
+class BitGrid:
+    def __init__(self, max_x: int, max_y: int, rows: Optional[List[int]] = None):
+        self.max_x = max_x
+        self.max_y = max_y
+        self.row_mask = (1 << max_y) - 1
+        self.rows = rows if rows is not None else [0] * max_x
+        assert(len(self.rows) == max_x)
+
+    ## Conversions
+    # Cells are set where predicate(value) is True (by default, where the value is truthy)
+    @staticmethod
+    def from_grid(grid: Grid, predicate: Optional[Callable[[Any], bool]] = None) -> "BitGrid":
+        if predicate is None:
+            predicate = bool
+        rows = []
+        for x in range(grid.max_x):
+            row = 0
+            for y in range(grid.max_y):
+                if predicate(grid.get(x, y)):
+                    row |= 1 << y
+            rows.append(row)
+        return BitGrid(grid.max_x, grid.max_y, rows)
+
+    @staticmethod
+    def from_lines(lines: List[str], chars: str = "#") -> "BitGrid":
+        rows = []
+        for line in lines:
+            row = 0
+            for y, c in enumerate(line):
+                if c in chars:
+                    row |= 1 << y
+            rows.append(row)
+        return BitGrid(len(lines), len(lines[0]) if len(lines) > 0 else 0, rows)
+
+    def to_grid(self, true_value: Any = True, false_value: Any = False) -> Grid:
+        return Grid([[true_value if (row >> y) & 1 else false_value for y in range(self.max_y)] for row in self.rows])
+
+    # Bit x * max_y + y of the BitSet is the cell (x, y)
+    @staticmethod
+    def from_bitset(bitset: BitSet, max_x: int, max_y: int) -> "BitGrid":
+        assert(bitset.size >= max_x * max_y)
+        value = 0
+        for i, word in enumerate(bitset.field):
+            value |= word << (64 * i)
+        row_mask = (1 << max_y) - 1
+        return BitGrid(max_x, max_y, [(value >> (x * max_y)) & row_mask for x in range(max_x)])
+
+    def to_bitset(self) -> BitSet:
+        res = BitSet(self.max_x * self.max_y)
+        value = 0
+        for x, row in enumerate(self.rows):
+            value |= row << (x * self.max_y)
+        for i in range(len(res.field)):
+            res.field[i] = (value >> (64 * i)) & 0xffffffffffffffff
+        return res
+
+    def copy(self) -> "BitGrid":
+        return BitGrid(self.max_x, self.max_y, list(self.rows))
+
+    ## Single cell access
+    def is_valid_xy(self, x: int, y: int) -> bool:
+        return x >= 0 and y >= 0 and x < self.max_x and y < self.max_y
+
+    def is_valid(self, p: Point) -> bool:
+        return self.is_valid_xy(p.x, p.y)
+
+    def get(self, x: int, y: int) -> bool:
+        return (self.rows[x] >> y) & 1 == 1
+
+    def set(self, x: int, y: int, v: bool = True) -> None:
+        if v:
+            self.rows[x] |= 1 << y
+        else:
+            self.rows[x] &= ~(1 << y)
+
+    def __getitem__(self, p: Point) -> bool:
+        return self.get(p.x, p.y)
+
+    def __setitem__(self, p: Point, v: bool) -> None:
+        self.set(p.x, p.y, v)
+
+    def find(self) -> List[Point]:
+        res = []
+        for x, row in enumerate(self.rows):
+            while row:
+                low = row & -row
+                res.append(Point(x, low.bit_length() - 1))
+                row ^= low
+        return res
+
+    ## Whole grid operations
+    def popcount(self) -> int:
+        return sum(row.bit_count() for row in self.rows)
+
+    def any(self) -> bool:
+        return any(self.rows)
+
+    # Moved by (dx, dy): result[x + dx, y + dy] = self[x, y]. Cells coming from outside of the grid are empty.
+    def shifted(self, dx: int, dy: int) -> "BitGrid":
+        if dy >= 0:
+            rows = [(row << dy) & self.row_mask for row in self.rows]
+        else:
+            rows = [row >> -dy for row in self.rows]
+
+        if dx > 0:
+            rows = [0] * min(dx, self.max_x) + rows[:max(self.max_x - dx, 0)]
+        elif dx < 0:
+            rows = rows[-dx:] + [0] * min(-dx, self.max_x)
+        return BitGrid(self.max_x, self.max_y, rows)
+
+    # Bit planes of the number of set neighbors of each cell: the count of cell (x, y) is
+    # sum(planes[i][x, y] << i). Computed with a bit-sliced adder over whole rows.
+    def neighbor_count_planes(self, discard_diagonal: bool = False) -> List["BitGrid"]:
+        planes = [[0] * self.max_x for _ in range(4)]
+        for incr_x in (-1, 0, 1):
+            for incr_y in (-1, 0, 1):
+                if incr_x == 0 and incr_y == 0:
+                    continue
+                if discard_diagonal and incr_x != 0 and incr_y != 0:
+                    continue
+                shifted = self.shifted(incr_x, incr_y).rows
+                for x in range(self.max_x):
+                    carry = shifted[x]
+                    for plane in planes:
+                        if carry == 0:
+                            break
+                        plane[x], carry = plane[x] ^ carry, plane[x] & carry
+        return [BitGrid(self.max_x, self.max_y, plane) for plane in planes]
+
+    # Cells that have exactly count set neighbors
+    def neighbor_count_equal(self, count: int, discard_diagonal: bool = False) -> "BitGrid":
+        planes = self.neighbor_count_planes(discard_diagonal)
+        rows = []
+        for x in range(self.max_x):
+            row = self.row_mask
+            for i, plane in enumerate(planes):
+                row &= plane.rows[x] if (count >> i) & 1 else ~plane.rows[x]
+            rows.append(row & self.row_mask)
+        return BitGrid(self.max_x, self.max_y, rows)
+
+    # Cells that have at least count set neighbors.
+    # One pass over the planes, from the most significant one: a cell is above count as soon as it has a bit set where
+    # count doesn't, while all the bits before were equal.
+    def neighbor_count_at_least(self, count: int, discard_diagonal: bool = False) -> "BitGrid":
+        if count <= 0:
+            return BitGrid(self.max_x, self.max_y, [self.row_mask] * self.max_x)
+        planes = self.neighbor_count_planes(discard_diagonal)
+        if count >= 1 << len(planes):
+            return BitGrid(self.max_x, self.max_y)
+
+        rows = []
+        for x in range(self.max_x):
+            above = 0
+            equal = self.row_mask
+            for i in reversed(range(len(planes))):
+                if (count >> i) & 1:
+                    equal &= planes[i].rows[x]
+                else:
+                    above |= equal & planes[i].rows[x]
+                    equal &= ~planes[i].rows[x]
+            rows.append((above | equal) & self.row_mask)
+        return BitGrid(self.max_x, self.max_y, rows)
+
+    ## Operators
+    def __and__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(self.max_x, self.max_y, [a & b for a, b in zip(self.rows, other.rows)])
+
+    def __or__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(self.max_x, self.max_y, [a | b for a, b in zip(self.rows, other.rows)])
+
+    def __xor__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(self.max_x, self.max_y, [a ^ b for a, b in zip(self.rows, other.rows)])
+
+    def __invert__(self) -> "BitGrid":
+        return BitGrid(self.max_x, self.max_y, [~a & self.row_mask for a in self.rows])
+
+    def __eq__(self, other: "BitGrid") -> bool:
+        return self.max_y == other.max_y and self.rows == other.rows
+
+    # Cheap enough to store all the states in a set/dict for cycle detection
+    def __hash__(self) -> int:
+        return hash((self.max_y, tuple(self.rows)))
+
+    def pretty_str(self, true_char: str = "#", false_char: str = ".") -> str:
+        return self.to_grid(true_char, false_char).pretty_str()
+
+    def __repr__(self) -> str:
+        return self.pretty_str()
+
+
+if __name__ == "__main__":
+    import random
+    from aoc.common.grid import NumpyGrid
+
+    random.seed(0)
+    lines = ["".join(random.choice(".#") for _ in range(70)) for _ in range(50)]
+    bitgrid = BitGrid.from_lines(lines)
+    numpy_grid = NumpyGrid.as_mask(lines, "#")
+
+    assert(bitgrid.popcount() == numpy_grid.count(True))
+    assert(bitgrid.find() == numpy_grid.find(True))
+    assert(BitGrid.from_bitset(bitgrid.to_bitset(), bitgrid.max_x, bitgrid.max_y) == bitgrid)
+    assert(BitGrid.from_grid(bitgrid.to_grid()) == bitgrid)
+    for dx, dy in ((1, 0), (-2, 3), (0, -5), (60, 0)):
+        assert(bitgrid.shifted(dx, dy).to_grid().grid == numpy_grid.shifted(dx, dy, False).tolist())
+    for discard_diagonal in (False, True):
+        counts = numpy_grid.neighbor_count(True, discard_diagonal=discard_diagonal)
+        for c in range(9):
+            assert(bitgrid.neighbor_count_equal(c, discard_diagonal).to_grid().grid == (counts == c).tolist())
+        assert(bitgrid.neighbor_count_at_least(4, discard_diagonal).to_grid().grid == (counts >= 4).tolist())
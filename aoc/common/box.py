@@ -0,0 +1,181 @@
+import numpy as np
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+# Axis-aligned boxes in N dimensions, on integers. Each axis is an inclusive range [min, max].
+# Used to count points in constraint spaces (2023/Day19 x/m/a/s ratings, 2021/Day22 reactor cuboids).
+class Box:
+    __slots__ = ("mins", "maxs")
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]]) -> None:
+        ranges = list(ranges)
+        self.mins: Tuple[int, ...] = tuple(r[0] for r in ranges)
+        self.maxs: Tuple[int, ...] = tuple(r[1] for r in ranges)
+        assert(all(a <= b for a, b in zip(self.mins, self.maxs)))
+
+    @staticmethod
+    def from_bounds(mins: Sequence[int], maxs: Sequence[int]) -> "Box":
+        return Box(zip(mins, maxs))
+
+    @property
+    def dim(self) -> int:
+        return len(self.mins)
+
+    def ranges(self) -> List[Tuple[int, int]]:
+        return list(zip(self.mins, self.maxs))
+
+    # Number of integer points in the box
+    def volume(self) -> int:
+        res = 1
+        for a, b in zip(self.mins, self.maxs):
+            res *= b - a + 1
+        return res
+
+    def contains(self, point: Sequence[int]) -> bool:
+        return all(a <= v <= b for a, v, b in zip(self.mins, point, self.maxs))
+
+    def contains_box(self, other: "Box") -> bool:
+        return all(a <= c and d <= b for a, b, c, d in zip(self.mins, self.maxs, other.mins, other.maxs))
+
+    def intersect(self, other: "Box") -> Optional["Box"]:
+        mins = tuple(map(max, self.mins, other.mins))
+        maxs = tuple(map(min, self.maxs, other.maxs))
+        if any(a > b for a, b in zip(mins, maxs)):
+            return None
+        return Box.from_bounds(mins, maxs)
+
+    # Copy with the range of one axis replaced
+    def with_axis(self, axis: int, min: int, max: int) -> "Box":
+        ranges = self.ranges()
+        ranges[axis] = (min, max)
+        return Box(ranges)
+
+    # Split on axis at threshold: the part with values < threshold, and the part with values >= threshold.
+    # A part is None if it is empty.
+    def split(self, axis: int, threshold: int) -> Tuple[Optional["Box"], Optional["Box"]]:
+        a, b = self.mins[axis], self.maxs[axis]
+        if threshold <= a:
+            return None, self
+        if threshold > b:
+            return self, None
+        return self.with_axis(axis, a, threshold - 1), self.with_axis(axis, threshold, b)
+
+    # self minus other, as a list of disjoint boxes (at most 2 per dimension)
+    def subtract(self, other: "Box") -> List["Box"]:
+        if self.intersect(other) is None:
+            return [self]
+
+        res = []
+        curr = self
+        for axis in range(self.dim):
+            below, curr = curr.split(axis, other.mins[axis])
+            if below is not None:
+                res.append(below)
+            curr, above = curr.split(axis, other.maxs[axis] + 1)
+            if above is not None:
+                res.append(above)
+        return res
+
+    def __eq__(self, other: "Box") -> bool:
+        return self.mins == other.mins and self.maxs == other.maxs
+
+    def __hash__(self) -> int:
+        return hash((self.mins, self.maxs))
+
+    def __repr__(self) -> str:
+        return "Box(" + ", ".join(f"{a}..{b}" for a, b in zip(self.mins, self.maxs)) + ")"
+
+
+# Volume of a union of boxes, with boxes that can be added or removed (like lights turned on or off).
+# Inclusion-exclusion: for each new box, the intersections with all the stored boxes are stored with the opposite sign.
+# The boxes are stored in numpy arrays, so each step is a few vectorized operations on all the stored boxes.
+class SignedVolumes:
+    def __init__(self, dim: int) -> None:
+        self.mins = np.empty((0, dim), dtype=np.int64)
+        self.maxs = np.empty((0, dim), dtype=np.int64)
+        self.signs = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.signs)
+
+    def add(self, box: Box) -> None:
+        self.update(box, True)
+
+    def remove(self, box: Box) -> None:
+        self.update(box, False)
+
+    def update(self, box: Box, add: bool) -> None:
+        box_mins = np.array(box.mins, dtype=np.int64)
+        box_maxs = np.array(box.maxs, dtype=np.int64)
+        mins = np.maximum(self.mins, box_mins)
+        maxs = np.minimum(self.maxs, box_maxs)
+        valid = (mins <= maxs).all(axis=1)
+
+        new_mins = [self.mins, mins[valid]]
+        new_maxs = [self.maxs, maxs[valid]]
+        new_signs = [self.signs, -self.signs[valid]]
+        if add:
+            new_mins.append(box_mins[None, :])
+            new_maxs.append(box_maxs[None, :])
+            new_signs.append(np.ones(1, dtype=np.int64))
+
+        self.mins = np.concatenate(new_mins)
+        self.maxs = np.concatenate(new_maxs)
+        self.signs = np.concatenate(new_signs)
+        self.compact()
+
+    # Merge the identical boxes, summing their signs, and drop the ones that cancel out
+    def compact(self) -> None:
+        keys = np.concatenate((self.mins, self.maxs), axis=1)
+        keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        signs = np.zeros(len(keys), dtype=np.int64)
+        np.add.at(signs, inverse.ravel(), self.signs)
+        keep = signs != 0
+        dim = self.mins.shape[1]
+        self.mins = keys[keep, :dim]
+        self.maxs = keys[keep, dim:]
+        self.signs = signs[keep]
+
+    def volume(self) -> int:
+        # Python ints, volumes can overflow int64
+        sizes = (self.maxs - self.mins + 1).tolist()
+        res = 0
+        for size, sign in zip(sizes, self.signs.tolist()):
+            v = sign
+            for s in size:
+                v *= s
+            res += v
+        return res
+
+
+# Volume covered at the end of a sequence of (box, on/off) steps, later steps overriding earlier ones.
+# Coordinate compression: the space is cut at all the box boundaries, and each cell of the compressed grid
+# is painted with numpy slices. The first axis is swept one slab at a time, so memory stays at one (N-1)-d grid.
+def compressed_volume(steps: Sequence[Tuple[Box, bool]]) -> int:
+    if len(steps) == 0:
+        return 0
+    dim = steps[0][0].dim
+    # Cells are [coords[k], coords[k + 1])
+    coords = [np.unique([v for box, _ in steps for v in (box.mins[axis], box.maxs[axis] + 1)]) for axis in range(dim)]
+    indexes = [[(int(np.searchsorted(coords[axis], box.mins[axis])), int(np.searchsorted(coords[axis], box.maxs[axis] + 1))) for axis in range(dim)] for box, _ in steps]
+    sizes = [np.diff(c) for c in coords]
+
+    # Volume of each cell of a slab, without the first axis
+    cell_volumes = np.ones([len(s) for s in sizes[1:]], dtype=np.int64)
+    for axis, s in enumerate(sizes[1:]):
+        shape = [1] * (dim - 1)
+        shape[axis] = len(s)
+        cell_volumes = cell_volumes * s.reshape(shape)
+
+    res = 0
+    for k in range(len(sizes[0])):
+        slab = np.zeros(cell_volumes.shape, dtype=bool)
+        painted = False
+        for (_, on), box_indexes in zip(steps, indexes):
+            a, b = box_indexes[0]
+            if not a <= k < b:
+                continue
+            slab[tuple(slice(a, b) for a, b in box_indexes[1:])] = on
+            painted = True
+        if painted:
+            res += int(sizes[0][k]) * int(cell_volumes[slab].sum())
+    return res
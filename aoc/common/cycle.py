@@ -0,0 +1,139 @@
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Cycle detection for periodic simulations.
+# A simulation is a state and a step function (state -> next state, it can modify the state in place and return it).
+# Only a compact fingerprint of each state is stored (never a copy of the state), along with an optional
+# metric per step (the load, the height of a tower, ...), which is enough to extrapolate to any step number.
+
+
+# After `start` steps, the simulation repeats itself every `length` steps.
+# metrics[i] is the metric after i steps, for i in [0, start + length), and end_metric the metric after start + length steps.
+class Cycle:
+    def __init__(self, start: int, length: int, metrics: List[Any], end_metric: Any = None):
+        self.start = start
+        self.length = length
+        self.metrics = metrics
+        self.end_metric = end_metric
+
+    # Step in [0, start + length) that has the same state as step n
+    def equivalent_step(self, n: int) -> int:
+        if n < self.start + self.length:
+            return n
+        return self.start + (n - self.start) % self.length
+
+    # Number of steps to do from a state equivalent to step `start` to reach a state equivalent to step n
+    def remaining_steps(self, n: int) -> int:
+        return (n - self.start) % self.length
+
+    # Change of the metric over one cycle
+    def cycle_delta(self) -> Any:
+        return self.end_metric - self.metrics[self.start]
+
+    # Metric after n steps. The metric needs to change by the same amount over each cycle:
+    # it works for periodic metrics (the change is 0) and for metrics growing linearly (like a height).
+    def metric_at(self, n: int) -> Any:
+        if n < len(self.metrics):
+            return self.metrics[n]
+
+        nb_cycles, remainder = divmod(n - self.start, self.length)
+        return self.metrics[self.start + remainder] + nb_cycles * self.cycle_delta()
+
+    def __repr__(self) -> str:
+        return f"Cycle(start={self.start}, length={self.length})"
+
+
+# Run the simulation until a fingerprint is seen twice, or until max_steps steps are done.
+# Returns the cycle (None if no cycle was found) and the current state. If a cycle is found,
+# the current state is at step start + length, which is equivalent to step start.
+def find_cycle(state: Any,
+               step: Callable[[Any], Any],
+               fingerprint: Callable[[Any], Hashable],
+               metric: Optional[Callable[[Any], Any]] = None,
+               max_steps: Optional[int] = None) -> Tuple[Optional[Cycle], Any]:
+    seen: Dict[Hashable, int] = {}
+    metrics = []
+    i = 0
+    while True:
+        current_fingerprint = fingerprint(state)
+        current_metric = metric(state) if metric is not None else None
+        if current_fingerprint in seen:
+            return Cycle(seen[current_fingerprint], i - seen[current_fingerprint], metrics, current_metric), state
+
+        seen[current_fingerprint] = i
+        metrics.append(current_metric)
+        if max_steps is not None and i >= max_steps:
+            return None, state
+
+        state = step(state)
+        i += 1
+
+
+# Metric after nb_steps steps, skipping all the full cycles.
+def fast_forward(state: Any,
+                 step: Callable[[Any], Any],
+                 fingerprint: Callable[[Any], Hashable],
+                 metric: Callable[[Any], Any],
+                 nb_steps: int) -> Any:
+    cycle, state = find_cycle(state, step, fingerprint, metric, nb_steps)
+    if cycle is None:
+        return metric(state)
+    return cycle.metric_at(nb_steps)
+
+
+# Brent's algorithm: finds the cycle in O(1) memory, without any dict.
+# Only works if step is a pure function (it must NOT modify the state in place),
+# as we keep two states alive. States need to support ==.
+# The simulation is run a second time from the start to record the metrics.
+def find_cycle_brent(state: Any, step: Callable[[Any], Any], metric: Optional[Callable[[Any], Any]] = None) -> Cycle:
+    # Find the length: the hare runs ahead, the tortoise teleports at each power of 2
+    power = 1
+    length = 1
+    tortoise = state
+    hare = step(state)
+    while tortoise != hare:
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+
+    # Find the start: both start from the beginning, with the hare length steps ahead
+    tortoise = state
+    hare = state
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while tortoise != hare:
+        tortoise = step(tortoise)
+        hare = step(hare)
+        start += 1
+
+    # Record the metrics
+    metrics = []
+    current = state
+    for _ in range(start + length):
+        metrics.append(metric(current) if metric is not None else None)
+        current = step(current)
+
+    return Cycle(start, length, metrics, metric(current) if metric is not None else None)
+
+
+if __name__ == "__main__":
+    # x -> x^2 + 1 mod 255 is eventually periodic, and the total grows by the same amount over each cycle
+    def lcg_step(state: Tuple[int, int]) -> Tuple[int, int]:
+        x, total = state
+        return ((x * x + 1) % 255, total + x)
+
+    nb_steps = 1000
+    expected = (3, 0)
+    for _ in range(nb_steps):
+        expected = lcg_step(expected)
+
+    cycle, _ = find_cycle((3, 0), lcg_step, lambda s: s[0], lambda s: s[1])
+    assert(cycle.metric_at(nb_steps) == expected[1])
+    assert(fast_forward((3, 0), lcg_step, lambda s: s[0], lambda s: s[1], nb_steps) == expected[1])
+    assert(fast_forward((3, 0), lcg_step, lambda s: s[0], lambda s: s[1], 2) == lcg_step(lcg_step((3, 0)))[1])
+
+    brent_cycle = find_cycle_brent(3, lambda x: (x * x + 1) % 255)
+    assert((brent_cycle.start, brent_cycle.length) == (cycle.start, cycle.length))
@@ -0,0 +1,68 @@
+import heapq
+from typing import Dict, List
+
+# Disjoint-set (union-find) on the elements 0..n-1.
+# Union by size and path compression: find and union are almost O(1).
+# To use it on other objects (Points, names, ...), map them to indexes first (like grid_astar does with cells).
+class DisjointSet:
+    def __init__(self, n: int) -> None:
+        self.parent: List[int] = list(range(n))
+        # Only valid for the roots
+        self.sizes: List[int] = [1] * n
+        self.nb_components = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    # Root of the component of x
+    def find(self, x: int) -> int:
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+
+        # Path compression
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+
+        return root
+
+    # Merge the components of a and b. Returns False if they were already in the same component.
+    def union(self, a: int, b: int) -> bool:
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return False
+
+        # The smallest tree goes under the biggest one
+        if self.sizes[a] < self.sizes[b]:
+            a, b = b, a
+
+        self.parent[b] = a
+        self.sizes[a] += self.sizes[b]
+        self.nb_components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    # Size of the component of x
+    def size(self, x: int) -> int:
+        return self.sizes[self.find(x)]
+
+    def roots(self) -> List[int]:
+        return [x for x, p in enumerate(self.parent) if x == p]
+
+    def component_sizes(self) -> List[int]:
+        return [self.sizes[root] for root in self.roots()]
+
+    # Sizes of the k biggest components, biggest first
+    def largest_sizes(self, k: int) -> List[int]:
+        return heapq.nlargest(k, self.component_sizes())
+
+    # All the components, as root -> elements
+    def components(self) -> Dict[int, List[int]]:
+        res: Dict[int, List[int]] = {}
+        for x in range(len(self.parent)):
+            res.setdefault(self.find(x), []).append(x)
+        return res
@@ -1,5 +1,6 @@
 from aoc.common.point import Point
-from typing import List, Any, Iterable, Generator
+from typing import List, Any, Iterable, Generator, Optional, Union
+import numpy as np
 
 class Grid:
     def __init__(self, grid: List[List[Any]]) -> None:
@@ -62,3 +63,107 @@ class Grid:
     
     def __hash__(self) -> int:
         return hash(tuple([tuple(x) for x in self.grid]))
+
+
+# Grid backed by a 2D numpy array. All the Grid methods keep working (Point indexing, iterate_row_first, pretty_str, ...),
+# and it adds vectorized helpers to work on the whole grid at once instead of looping in Python.
+class NumpyGrid(Grid):
+    def __init__(self, grid: Union[np.ndarray, List[List[Any]], List[str]]) -> None:
+        if not isinstance(grid, np.ndarray):
+            grid = np.array([list(line) for line in grid])
+        assert(grid.ndim == 2)
+        self.grid = grid
+        self.max_x, self.max_y = grid.shape
+
+    @staticmethod
+    def as_int_grid(grid: Iterable[Iterable[Any]]) -> "NumpyGrid":
+        return NumpyGrid(np.array([[int(a) for a in line] for line in grid], dtype=np.int64))
+
+    # Boolean grid, True where the character is one of the given characters
+    @staticmethod
+    def as_mask(grid: Iterable[str], chars: str) -> "NumpyGrid":
+        return NumpyGrid(np.array([[c in chars for c in line] for line in grid], dtype=bool))
+
+    @staticmethod
+    def from_grid(grid: Grid) -> "NumpyGrid":
+        return NumpyGrid(grid.grid)
+
+    def to_grid(self) -> Grid:
+        return Grid(self.grid.tolist())
+
+    def copy(self) -> "NumpyGrid":
+        return NumpyGrid(self.grid.copy())
+
+    def iterate_row_first(self) -> Generator[Any]:
+        yield from self.grid.ravel().tolist()
+
+    def iterate_col_first(self) -> Generator[Any]:
+        yield from self.grid.ravel(order="F").tolist()
+
+    def get(self, x: int, y: int) -> Any:
+        return self.grid[x, y]
+
+    def set(self, x: int, y: int, v: Any) -> None:
+        self.grid[x, y] = v
+
+    def pretty_str(self, cell_size = 1, separator = "") -> str:
+        return Grid(self.grid.tolist()).pretty_str(cell_size, separator)
+
+    def __eq__(self, other: "Grid") -> bool:
+        if isinstance(other, NumpyGrid):
+            return np.array_equal(self.grid, other.grid)
+        return self.grid.tolist() == other.grid
+
+    def __hash__(self) -> int:
+        return hash((self.grid.shape, self.grid.tobytes()))
+
+    ## Vectorized helpers
+    # Mask of the cells equal to value
+    def mask(self, value: Any) -> np.ndarray:
+        return self.grid == value
+
+    def count(self, value: Any) -> int:
+        return int(np.count_nonzero(self.grid == value))
+
+    # All the positions where mask is True (or where the grid is equal to value), row first.
+    def find(self, value: Any = None, mask: Optional[np.ndarray] = None) -> List[Point]:
+        if mask is None:
+            mask = self.grid == value
+        return [Point(x, y) for x, y in np.argwhere(mask).tolist()]
+
+    # Copy of the grid moved by (dx, dy): result[x + dx, y + dy] = grid[x, y].
+    # Cells coming from outside of the grid are set to fill.
+    def shifted(self, dx: int, dy: int, fill: Any = 0) -> np.ndarray:
+        return shift_array(self.grid, dx, dy, fill)
+
+    # For each cell, number of neighbors where mask is True (or where the grid is equal to value).
+    # Cells outside of the grid are not counted.
+    def neighbor_count(self, value: Any = None, mask: Optional[np.ndarray] = None, discard_diagonal: bool = False) -> np.ndarray:
+        if mask is None:
+            mask = self.grid == value
+        return neighbor_count(mask, discard_diagonal)
+
+
+def shift_array(array: np.ndarray, dx: int, dy: int, fill: Any = 0) -> np.ndarray:
+    res = np.full_like(array, fill)
+    max_x, max_y = array.shape
+    if abs(dx) >= max_x or abs(dy) >= max_y:
+        return res
+    res[max(dx, 0):max_x + min(dx, 0), max(dy, 0):max_y + min(dy, 0)] = array[max(-dx, 0):max_x + min(-dx, 0), max(-dy, 0):max_y + min(-dy, 0)]
+    return res
+
+
+# Number of True neighbors of each cell of a 2D boolean array (8 neighbors, or 4 if discard_diagonal).
+# Equivalent to a convolution with a 3x3 kernel of ones with a 0 center, with a zero padding.
+def neighbor_count(mask: np.ndarray, discard_diagonal: bool = False) -> np.ndarray:
+    padded = np.pad(mask.astype(np.int8), 1)
+    max_x, max_y = mask.shape
+    res = np.zeros(mask.shape, dtype=np.int8)
+    for incr_x in (-1, 0, 1):
+        for incr_y in (-1, 0, 1):
+            if incr_x == 0 and incr_y == 0:
+                continue
+            if discard_diagonal and incr_x != 0 and incr_y != 0:
+                continue
+            res += padded[1 + incr_x:1 + incr_x + max_x, 1 + incr_y:1 + incr_y + max_y]
+    return res
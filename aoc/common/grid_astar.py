@@ -0,0 +1,134 @@
+import abc
+import heapq
+import math
+from typing import List, Any, Tuple
+from aoc.common.grid import Grid
+from aoc.common.point import Point
+
+# A* solver specialized for grids.
+# Instead of hashing Point objects (or wrappers around them), each state is an int:
+#   index = (x * width + y) * nb_extra + extra
+# where extra is an optional additional dimension (direction, number of straight moves, ...) in [0, nb_extra).
+# g_score and parents are stored in preallocated lists indexed by state, so no dict/set is used during the search.
+# Same contract as AStar_Solver: the heuristic must NEVER OVERESTIMATE the real cost, and costs must be positive.
+# solve() returns the list of states from start to end, like AStar_Solver.solve (see to_state).
+class GridAStar_Solver(abc.ABC):
+    def __init__(self, grid: Grid, nb_extra: int = 1):
+        self.grid = grid
+        self.width = grid.max_y
+        self.height = grid.max_x
+        self.nb_cells = self.width * self.height
+        self.nb_extra = nb_extra
+        self.nb_states = self.nb_cells * nb_extra
+
+        # 4-neighbors cell indexes of each cell, computed once
+        self.cell_neighbors: List[List[int]] = []
+        for x in range(self.height):
+            for y in range(self.width):
+                neighbors = []
+                if x > 0:
+                    neighbors.append(self.cell_index(x - 1, y))
+                if y > 0:
+                    neighbors.append(self.cell_index(x, y - 1))
+                if y < self.width - 1:
+                    neighbors.append(self.cell_index(x, y + 1))
+                if x < self.height - 1:
+                    neighbors.append(self.cell_index(x + 1, y))
+                self.cell_neighbors.append(neighbors)
+
+        # Filled by the last solve call
+        self.g_score: List[float] = []
+        self.parent: List[int] = []
+        self.nb_expanded = 0
+
+    ## Index conversions
+    def cell_index(self, x: int, y: int) -> int:
+        return x * self.width + y
+
+    def cell_position(self, cell: int) -> Tuple[int, int]:
+        return divmod(cell, self.width)
+
+    def index(self, x: int, y: int, extra: int = 0) -> int:
+        return (x * self.width + y) * self.nb_extra + extra
+
+    def point_index(self, p: Point, extra: int = 0) -> int:
+        return self.index(p.x, p.y, extra)
+
+    # Returns x, y and extra
+    def position(self, index: int) -> Tuple[int, int, int]:
+        cell, extra = divmod(index, self.nb_extra)
+        x, y = divmod(cell, self.width)
+        return x, y, extra
+
+    # Convert an index to the state returned by solve. By default it is a Point, or a (Point, extra) tuple
+    # if there is an extra dimension. Can re-implement it to return your own state class.
+    def to_state(self, index: int) -> Any:
+        x, y, extra = self.position(index)
+        if self.nb_extra == 1:
+            return Point(x, y)
+        return Point(x, y), extra
+
+    ## To implement
+    def heuristic(self, index: int) -> int:
+        return 0
+
+    # Returns a list of (index, cost) for all the states reachable from index
+    @abc.abstractmethod
+    def get_neighbors(self, index: int) -> List[Tuple[int, int]]:
+        pass
+
+    @abc.abstractmethod
+    def is_end(self, index: int) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def get_start_indexes(self) -> List[int]:
+        pass
+
+    ## Solve
+    # Can re-implement this function if we want to do some pre-processing/post-processing
+    def solve(self) -> Any:
+        return self.solve_internal()
+
+    def solve_internal(self) -> List[Any]:
+        return [self.to_state(i) for i in self.solve_indexes()]
+
+    # Returns the indexes of the states of the shortest path, from start to end.
+    def solve_indexes(self) -> List[int]:
+        g_score = [math.inf] * self.nb_states
+        parent = [-1] * self.nb_states
+        closed = bytearray(self.nb_states)
+        self.g_score = g_score
+        self.parent = parent
+        self.nb_expanded = 0
+
+        heuristic = self.heuristic
+        heap = []
+        for s in self.get_start_indexes():
+            g_score[s] = 0
+            heap.append((heuristic(s), 0, s))
+        heapq.heapify(heap)
+
+        while len(heap) > 0:
+            _, state_gscore, state = heapq.heappop(heap)
+            if closed[state] or state_gscore > g_score[state]:
+                continue
+
+            if self.is_end(state):
+                res = [state]
+                while parent[res[-1]] != -1:
+                    res.append(parent[res[-1]])
+                return res[::-1]
+
+            closed[state] = 1
+            self.nb_expanded += 1
+            for s, cost in self.get_neighbors(state):
+                tentative_gscore = state_gscore + cost
+                if tentative_gscore < g_score[s]:
+                    g_score[s] = tentative_gscore
+                    parent[s] = state
+                    closed[s] = 0
+                    heapq.heappush(heap, (tentative_gscore + heuristic(s), tentative_gscore, s))
+
+        # Failed
+        return []
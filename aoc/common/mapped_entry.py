@@ -0,0 +1,138 @@
+# Memory-mapped reader, for inputs too big to be read with parse_entry (synthetic stress tests of hundreds of MB).
+# Nothing is copied: lines and parts are slices of the mapped file (memoryview), only read by the OS when accessed.
+# Usage:
+#   with MappedEntry(path) as entry:
+#       for line in entry.lines(): ...           memoryview of each line, bytes(line) or line.tobytes() to copy it
+#       rules, updates = entry.parts(b"---", 2)  MappedPart of each part
+#       seeds = entry.to_array()                 all the integers as a NumPy array
+#       disk_map = entry.digits()                each digit of the first line as a NumPy array
+# The slices must be released (del, or out of scope) before closing the entry.
+import mmap
+import os
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+import numpy as np
+
+whitespaces = b" \t\r\n"
+
+
+# All the integers of a buffer, in order, and the position of their first digit.
+# With signed, a '-' just before the digits makes them negative.
+def integer_runs(buffer, signed: bool = False, dtype=None) -> Tuple[np.ndarray, np.ndarray]:
+    dtype = np.int64 if dtype is None else dtype
+    chars = np.frombuffer(buffer, dtype=np.uint8)
+    is_digit = (chars >= ord('0')) & (chars <= ord('9'))
+    edges = np.diff(is_digit.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    if len(starts) == 0:
+        return np.zeros(0, dtype=dtype), starts
+    ends = np.flatnonzero(edges == -1)
+    lengths = ends - starts
+
+    if lengths.max() >= len(str(np.iinfo(dtype).max)):
+        # Some numbers may not fit in dtype: exact Python ints instead (an object array)
+        values = np.array([int(bytes(chars[start:end])) for start, end in zip(starts.tolist(), ends.tolist())], dtype=object)
+    else:
+        # Numbers are short: add one digit of every number at a time, aligned on their last digit
+        values = np.zeros(len(starts), dtype=dtype)
+        for k in range(int(lengths.max()), 0, -1):
+            positions = ends - k
+            has_digit = positions >= starts
+            digits = chars[np.maximum(positions, 0)].astype(dtype) - ord('0')
+            values = np.where(has_digit, values * 10 + digits, values)
+
+    if signed:
+        negative = starts > 0
+        negative[negative] = chars[starts[negative] - 1] == ord('-')
+        values[negative] *= -1
+    return values, starts
+
+
+def integers(buffer, signed: bool = False, dtype=None) -> np.ndarray:
+    return integer_runs(buffer, signed, dtype)[0]
+
+
+class MappedPart:
+    def __init__(self, buffer, view: memoryview, start: int, end: int) -> None:
+        # buffer is searched (find), view is sliced
+        self.buffer = buffer
+        self.view = view
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def tobytes(self) -> bytes:
+        return self.view[self.start:self.end].tobytes()
+
+    # (start, end) of each line, without the trailing newline, and without whitespaces around it if should_strip
+    def line_bounds(self, should_strip: bool = True) -> Iterator[Tuple[int, int]]:
+        pos = self.start
+        while pos < self.end:
+            newline = self.buffer.find(b"\n", pos, self.end)
+            if newline == -1:
+                newline = self.end
+            start, end = pos, newline
+            if should_strip:
+                while start < end and self.buffer[start] in whitespaces:
+                    start += 1
+                while end > start and self.buffer[end - 1] in whitespaces:
+                    end -= 1
+            yield start, end
+            pos = newline + 1
+
+    def lines(self, should_strip: bool = True) -> Iterator[memoryview]:
+        for start, end in self.line_bounds(should_strip):
+            yield self.view[start:end]
+
+    # Same parts as parse_entry_multiple_parts: split on the separator lines, padded with None up to expected_parts
+    def parts(self, separator: bytes = b"---", expected_parts: Optional[int] = None) -> List[Optional["MappedPart"]]:
+        separator = separator.strip()
+        result = []
+        part_start = self.start
+        pos = self.start
+        for start, end in self.line_bounds():
+            if end - start == len(separator) and self.buffer[start:end] == separator:
+                result.append(MappedPart(self.buffer, self.view, part_start, pos))
+                part_start = self.buffer.find(b"\n", end, self.end) + 1 or self.end
+            pos = self.buffer.find(b"\n", end, self.end) + 1 or self.end
+        if part_start < self.end:
+            result.append(MappedPart(self.buffer, self.view, part_start, self.end))
+
+        if expected_parts is not None:
+            while len(result) < expected_parts:
+                result.append(None)
+            assert len(result) == expected_parts
+        return result
+
+    def to_array(self, signed: bool = False, dtype=None) -> np.ndarray:
+        return integers(self.view[self.start:self.end], signed, dtype)
+
+    # Digits of the first line, for inputs like "2333133121414131402"
+    def digits(self, dtype=np.int8) -> np.ndarray:
+        start, end = next(self.line_bounds(), (self.start, self.start))
+        return (np.frombuffer(self.view[start:end], dtype=np.uint8) - ord('0')).astype(dtype)
+
+
+class MappedEntry(MappedPart):
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        self.file = self.path.open("rb")
+        size = os.fstat(self.file.fileno()).st_size
+        # An empty file can't be mapped
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size > 0 else None
+        buffer = self.map if self.map is not None else b""
+        super().__init__(buffer, memoryview(buffer), 0, size)
+
+    def close(self) -> None:
+        self.view.release()
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+    def __enter__(self) -> "MappedEntry":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -1,5 +1,11 @@
-from multiprocessing import Pool
-from typing import Callable, List, Any, Optional, Tuple
+import atexit
+import itertools
+import os
+import queue
+import sys
+import time
+from multiprocessing import Pool, Value
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Sequence, Tuple
 
 
 # Simple wrapper to unwrap the arguments coming as input
@@ -11,12 +17,251 @@ class MultiWrapper:
         return self.func(*input)
 
 
+# Read-only data installed once in each worker process (see ProcessPool shared argument)
+shared_data: Dict[str, Any] = {}
+
+
+def _install_shared_data(data: Dict[str, Any]) -> None:
+    shared_data.update(data)
+
+
+# To be called from a worker function, to get data given to the pool as shared
+def get_shared(name: str) -> Any:
+    return shared_data[name]
+
+
+# Folds a whole shard in a worker: only the partial aggregate is sent back
+class FoldShard:
+    def __init__(self, fold: Callable[[Any, Any], Any], initial: Callable[[], Any]):
+        self.fold = fold
+        self.initial = initial
+
+    def __call__(self, shard: Sequence[Any]) -> Any:
+        acc = self.initial()
+        for item in shard:
+            acc = self.fold(acc, item)
+        return acc
+
+
+# Pool of worker processes that is created once and reused for many calls.
+# shared: read-only data installed in each worker when it starts, instead of being pickled with every task.
+# With the fork start method (default on Linux), workers inherit it from the parent without any copy.
+# Worker functions need to be importable (module level), and to exist when the pool is created if they are in __main__.
+class ProcessPool:
+    def __init__(self, num_processes: Optional[int] = None, shared: Optional[Dict[str, Any]] = None):
+        self.shared = shared if shared is not None else {}
+        # Also available in the main process while the pool is open, so the same worker functions can be called directly.
+        # The values it hides (from an enclosing pool) are put back on close.
+        self.hidden_shared = {name: shared_data[name] for name in self.shared if name in shared_data}
+        _install_shared_data(self.shared)
+        self.num_processes = num_processes if num_processes is not None else os.cpu_count()
+        self.pool = Pool(self.num_processes, initializer=_install_shared_data, initargs=(self.shared,))
+
+    # Tasks are sent by chunks, to not pay the inter process cost for each item.
+    # By default, about 4 chunks per process.
+    def get_chunksize(self, input_list: Iterable[Any], chunksize: Optional[int]) -> int:
+        if chunksize is not None:
+            return chunksize
+        if not hasattr(input_list, "__len__"):
+            return 1
+        return max(1, len(input_list) // (self.num_processes * 4))
+
+    # Results in the same order as input_list
+    def map(self, func: Callable, input_list: Iterable[Any], chunksize: Optional[int] = None) -> List[Any]:
+        return self.pool.map(func, input_list, self.get_chunksize(input_list, chunksize))
+
+    # Results as soon as they are ready, in any order
+    def imap_unordered(self, func: Callable, input_list: Iterable[Any], chunksize: Optional[int] = None) -> Iterator[Any]:
+        return self.pool.imap_unordered(func, input_list, self.get_chunksize(input_list, chunksize))
+
+    # Incremental reduction: each result is combined with the accumulator as soon as it arrives,
+    # so the list of all the results is never built. Results come in any order, so combine needs to be commutative.
+    def map_reduce(self, func: Callable, input_list: Iterable[Any], combine: Callable[[Any, Any], Any], initial: Any, chunksize: Optional[int] = None) -> Any:
+        acc = initial
+        for res in self.imap_unordered(func, input_list, chunksize):
+            acc = combine(acc, res)
+        return acc
+
+    # Streaming map-reduce: input_list is cut in nb_shards shards (default: one per process),
+    # each worker folds its items into its own partial aggregate, created by initial(),
+    # and the partial aggregates are merged as they arrive. merge needs to be associative and commutative.
+    # Only one aggregate per shard goes through IPC, so memory and IPC depend on the number of shards, not of items.
+    def fold_shards(self, fold: Callable[[Any, Any], Any], input_list: Sequence[Any], initial: Callable[[], Any], merge: Callable[[Any, Any], Any], nb_shards: Optional[int] = None) -> Any:
+        nb_shards = nb_shards if nb_shards is not None else self.num_processes
+        shards = [input_list[i::nb_shards] for i in range(nb_shards)]
+        shards = [shard for shard in shards if len(shard) > 0]
+        if len(shards) == 0:
+            return initial()
+
+        results = self.imap_unordered(FoldShard(fold, initial), shards, chunksize=1)
+        acc = next(results)
+        for res in results:
+            acc = merge(acc, res)
+        return acc
+
+    def remove_shared_data(self) -> None:
+        for name in self.shared:
+            shared_data.pop(name, None)
+        _install_shared_data(self.hidden_shared)
+        self.shared = {}
+
+    def close(self) -> None:
+        self.pool.close()
+        self.pool.join()
+        self.remove_shared_data()
+
+    def terminate(self) -> None:
+        self.pool.terminate()
+        self.remove_shared_data()
+
+    def __enter__(self) -> "ProcessPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+# Live figures of a parallel_search
+class SearchProgress:
+    def __init__(self, total: Optional[int]):
+        self.start_time = time.perf_counter()
+        self.total = total
+        self.tested = 0
+        self.best: Optional[Any] = None
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    # Candidates tested per second
+    @property
+    def throughput(self) -> float:
+        elapsed = self.elapsed
+        return self.tested / elapsed if elapsed > 0 else 0.0
+
+    # Fraction of the search space tested, None if the space has no length
+    @property
+    def progress(self) -> Optional[float]:
+        if self.total is None or self.total == 0:
+            return None
+        return self.tested / self.total
+
+    def __repr__(self) -> str:
+        progress = self.progress
+        progress = f" ({progress * 100:.1f}%)" if progress is not None else ""
+        return f"{self.tested} tested{progress} in {self.elapsed:.1f}s, {self.throughput:.0f}/s, best: {self.best}"
+
+
+# Tests the candidates of one block in order. Gives up if a block before this one already found a candidate.
+# Returns (block_index, first valid candidate or None, number of candidates tested)
+def _search_block(predicate: Callable[[Any], bool], block_index: int, block: Iterable[Any]) -> Tuple[int, Optional[Any], int]:
+    best_block = get_shared("search_best_block")
+    tested = 0
+    for candidate in block:
+        if predicate(candidate):
+            return block_index, candidate, tested + 1
+        tested += 1
+        if tested % 1024 == 0 and 0 <= best_block.value < block_index:
+            break
+    return block_index, None, tested
+
+
+# Smallest candidate of space (first in iteration order) for which predicate is True, None if there is none.
+# space: a range (cut in sub ranges) or any iterable, even infinite like itertools.count().
+# It is cut in blocks of block_size candidates, tested in parallel, in order. As soon as a block finds a candidate,
+# no new blocks are started and the blocks after it stop. The search ends when all the blocks before it are done,
+# as then the candidate is the minimal one.
+# progress, if given, is called with a SearchProgress about every progress_interval seconds.
+# predicate must be picklable (module level function or object).
+def parallel_search(predicate: Callable[[Any], bool],
+                    space: Iterable[Any],
+                    num_processes: Optional[int] = None,
+                    block_size: int = 100000,
+                    progress: Optional[Callable[[SearchProgress], None]] = None,
+                    progress_interval: float = 1.0) -> Optional[Any]:
+    best_block = Value("q", -1)
+    status = SearchProgress(len(space) if hasattr(space, "__len__") else None)
+
+    if isinstance(space, range):
+        blocks = (space[i:i + block_size] for i in range(0, len(space), block_size))
+    else:
+        iterator = iter(space)
+        blocks = iter(lambda: list(itertools.islice(iterator, block_size)), [])
+
+    results: queue.Queue = queue.Queue()
+    best = None
+    last_report = time.perf_counter()
+    with ProcessPool(num_processes, shared={"search_best_block": best_block}) as pool:
+        max_in_flight = pool.num_processes * 2
+        in_flight = 0
+        next_index = 0
+        while True:
+            # Keep the workers busy, unless a candidate was found
+            while best is None and in_flight < max_in_flight:
+                block = next(blocks, None)
+                if block is None:
+                    break
+                pool.pool.apply_async(_search_block, (predicate, next_index, block), callback=results.put, error_callback=results.put)
+                next_index += 1
+                in_flight += 1
+
+            if in_flight == 0:
+                break
+
+            try:
+                res = results.get(timeout=progress_interval)
+            except queue.Empty:
+                res = None
+
+            if isinstance(res, BaseException):
+                raise res
+            if res is not None:
+                in_flight -= 1
+                block_index, candidate, tested = res
+                status.tested += tested
+                if candidate is not None and (best_block.value < 0 or block_index < best_block.value):
+                    best_block.value = block_index
+                    best = candidate
+                    status.best = best
+
+            if progress is not None and time.perf_counter() - last_report >= progress_interval:
+                progress(status)
+                last_report = time.perf_counter()
+
+    if progress is not None:
+        progress(status)
+    return best
+
+
+# Pools without shared data, created on first use and kept until the end of the process, or until another __main__
+# uses them: forked workers only know the functions of the __main__ they were forked from, and aoc.runner runs many
+# solutions in one process (it also closes them after each solution).
+pools: Dict[int, ProcessPool] = {}
+pools_main: Dict[str, Any] = {"module": None}
+
+
+def get_pool(num_processes: int) -> ProcessPool:
+    main = sys.modules.get("__main__")
+    if pools_main["module"] is not main:
+        close_pools()
+        pools_main["module"] = main
+    if num_processes not in pools:
+        pools[num_processes] = ProcessPool(num_processes)
+    return pools[num_processes]
+
+
+@atexit.register
+def close_pools() -> None:
+    for pool in pools.values():
+        pool.terminate()
+    pools.clear()
+    pools_main["module"] = None
+
+
 def execute_async(num_threads: int, func: Callable, input_list: List[Tuple[Any]], reduce_func: Optional[Callable] = None):
-    result = None
-    with Pool(num_threads) as p:
-        result = p.map(func, input_list)
-        if reduce_func is not None:
-            result = reduce_func(result)
+    result = get_pool(num_threads).map(func, input_list)
+    if reduce_func is not None:
+        result = reduce_func(result)
 
     return result
 
@@ -27,6 +272,15 @@ if __name__ == "__main__":
     
     def reduce_multi(a: int, b: int, c: int) -> int:
         return a + b + c
+
+    def scale(x: int) -> int:
+        return x * get_shared("factor")
+
+    def add_scaled(acc: int, x: int) -> int:
+        return acc + scale(x)
+
+    def is_big_multiple(x: int) -> bool:
+        return x > 1000 and x % 97 == 0
     
     data = [[2,3,4], [5,6,7], [7,8,9], [11, 11, 11]]
     single_thread_result = [reduce(d) for d in data]
@@ -42,3 +296,14 @@ if __name__ == "__main__":
     assert(single_thread_result_reduced == multi_thread_result_reduce)
     assert(single_thread_result == multi_thread_multi_result)
     assert(single_thread_result_reduced == multi_thread_multi_result_reduced)
+
+    with ProcessPool(4, shared={"factor": 3}) as pool:
+        assert(pool.map(scale, range(100), chunksize=7) == [3 * x for x in range(100)])
+        assert(pool.map_reduce(scale, range(100), lambda a, b: a + b, 0) == 3 * sum(range(100)))
+        assert(pool.fold_shards(add_scaled, list(range(100)), int, lambda a, b: a + b) == 3 * sum(range(100)))
+
+    assert(parallel_search(is_big_multiple, range(10000), 4, block_size=100) == 1067)
+    assert(parallel_search(is_big_multiple, itertools.count(), 4, block_size=7) == 1067)
+    assert(parallel_search(is_big_multiple, range(1000), 4) is None)
+    # Shared data only lives as long as its pool
+    assert("factor" not in shared_data and "search_best_block" not in shared_data)
@@ -0,0 +1,109 @@
+# On-disk cache of parsed inputs.
+# A parser decorated with @cached_parser is only run once for a given input: its result is pickled in .cache/parse/
+# and loaded on the next runs. The key is the hash of the input lines, of the other arguments, and of the source file
+# of the parser (so any change to the solution invalidates its cache). Changes to aoc.common modules used by the parser
+# are not tracked: bump the version of the parser, or clear the cache, with AOC_PARSE_CACHE=clear.
+# Options, with the environment variable AOC_PARSE_CACHE:
+# unset or 1: use the cache
+# 0: never use the cache
+# clear: delete the cache, then use it
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+cache_folder = Path(os.path.abspath(__file__)).parent.parent.parent / ".cache" / "parse"
+cache_options = {
+    "enabled": os.environ.get("AOC_PARSE_CACHE", "1") != "0",
+}
+
+# Results of the cache, for the benchmarks
+cache_stats = {"hits": 0, "misses": 0}
+
+
+def clear_cache() -> None:
+    shutil.rmtree(cache_folder, ignore_errors=True)
+
+if os.environ.get("AOC_PARSE_CACHE") == "clear":
+    clear_cache()
+
+
+@functools.cache
+def source_hash(func: Callable) -> str:
+    try:
+        with open(inspect.getsourcefile(func), "rb") as f:
+            source = f.read()
+    except (TypeError, OSError):
+        source = func.__code__.co_code
+    return hashlib.sha256(source).hexdigest()
+
+
+# Hash of the input (a list of lines, a text, or the Path of a file) and of the other arguments
+def input_hash(func: Callable, version: int, entry: Any, args: tuple, kwargs: dict) -> str:
+    h = hashlib.sha256()
+    h.update(f"{func.__module__}.{func.__qualname__}:{version}:{sys.version_info[:2]}:{source_hash(func)}".encode())
+    if isinstance(entry, Path):
+        h.update(entry.read_bytes())
+    elif isinstance(entry, str):
+        h.update(entry.encode())
+    else:
+        for line in entry:
+            h.update(repr(line).encode())
+            h.update(b"\n")
+    h.update(repr((args, sorted(kwargs.items()))).encode())
+    return h.hexdigest()
+
+
+def load(path: Path) -> Optional[tuple]:
+    try:
+        with path.open("rb") as f:
+            return (pickle.load(f),)
+    except Exception:
+        # Missing, or written by an older version of the classes: parse again
+        return None
+
+
+def store(path: Path, result: Any) -> None:
+    temp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with temp.open("wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Atomic, other processes never read a partial file
+        os.replace(temp, path)
+    except Exception:
+        # Not picklable, or read-only folder: the result is still used, just not cached
+        temp.unlink(missing_ok=True)
+
+
+# The parser takes the input (lines, text, or the Path of the file) as first argument, the result must be picklable.
+# Classes defined in a solution must be importable the same way on every run (always run the solution as __main__,
+# directly or through aoc.runner).
+def cached_parser(func: Optional[Callable] = None, *, version: int = 0):
+    def decorator(func: Callable):
+        @functools.wraps(func)
+        def wrapper(entry: Any, *args, **kwargs):
+            if not cache_options["enabled"]:
+                return func(entry, *args, **kwargs)
+
+            key = input_hash(func, version, entry, args, kwargs)
+            path = cache_folder / f"{func.__qualname__}-{key[:32]}.pickle"
+            cached = load(path)
+            if cached is not None:
+                cache_stats["hits"] += 1
+                return cached[0]
+
+            cache_stats["misses"] += 1
+            result = func(entry, *args, **kwargs)
+            store(path, result)
+            return result
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -1,5 +1,8 @@
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from collections.abc import Sequence
+import copy
 import os
+import re
 from pathlib import Path
 
 default_separator = "---"
@@ -48,3 +51,189 @@ def parse_all_multiple_parts(relative_file: str, separator: str, expected_parts:
     root = Path(os.path.abspath(relative_file)).parent
 
     return [parse_entry_multiple_parts(root / file, separator, expected_parts, should_strip=should_strip) for file in args]
+
+
+## Lazy inputs
+# Files read by the lazy handles, by (path, options), so each one is only read once per process
+entry_cache: Dict[Tuple[Any, ...], List[Any]] = {}
+
+def cached_entry(path: Path, should_strip: bool = True) -> List[str]:
+    key = (path, should_strip)
+    if key not in entry_cache:
+        entry_cache[key] = parse_entry(path, should_strip=should_strip)
+    # A copy, solutions are allowed to modify their entries
+    return list(entry_cache[key])
+
+def cached_entry_multiple_parts(path: Path, separator: str, expected_parts: int, should_strip: bool = True) -> List[List[str]]:
+    key = (path, separator, expected_parts, should_strip)
+    if key not in entry_cache:
+        entry_cache[key] = parse_entry_multiple_parts(path, separator, expected_parts, should_strip=should_strip)
+    return [None if part is None else list(part) for part in entry_cache[key]]
+
+# Behaves like the list returned by parse_entry (or parse_entry_multiple_parts with a separator), but only reads the
+# file on first access. Importing a solution then doesn't read its inputs, only running it does.
+# It is a Sequence, not a list: load() gives the list itself (for isinstance checks or json). It is pickled with its
+# path (and its content, once loaded), so it can be sent to a ProcessPool.
+class LazyEntries(Sequence):
+    def __init__(self, path: Path, separator: Optional[str] = None, expected_parts: int = 0, should_strip: bool = True) -> None:
+        self._path = path
+        self._separator = separator
+        self._expected_parts = expected_parts
+        self._should_strip = should_strip
+        self._entries = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._entries is not None
+
+    def load(self) -> List[Any]:
+        if self._entries is None:
+            if self._separator is None:
+                self._entries = cached_entry(self._path, self._should_strip)
+            else:
+                self._entries = cached_entry_multiple_parts(self._path, self._separator, self._expected_parts, self._should_strip)
+        return self._entries
+
+    def __reduce__(self):
+        return (LazyEntries, (self._path, self._separator, self._expected_parts, self._should_strip), self._entries)
+
+    def __setstate__(self, entries: Optional[List[Any]]) -> None:
+        self._entries = entries
+
+    # Copies are plain lists, like the copy of a list
+    def __copy__(self) -> List[Any]:
+        return list(self.load())
+
+    def __deepcopy__(self, memo) -> List[Any]:
+        return copy.deepcopy(self.load(), memo)
+
+    def __getitem__(self, index):
+        return self.load()[index]
+
+    def __setitem__(self, index, value) -> None:
+        self.load()[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self.load()[index]
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.load())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self.load())
+
+    def __contains__(self, value) -> bool:
+        return value in self.load()
+
+    def __add__(self, other) -> List[Any]:
+        return self.load() + list(other)
+
+    def __radd__(self, other) -> List[Any]:
+        return list(other) + self.load()
+
+    def __iadd__(self, other) -> "LazyEntries":
+        self.load().extend(other)
+        return self
+
+    def __mul__(self, n: int) -> List[Any]:
+        return self.load() * n
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other) -> bool:
+        if type(other) is LazyEntries:
+            other = other.load()
+        return self.load() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.load())
+
+    # The methods of list that Sequence doesn't have
+    def append(self, value) -> None:
+        self.load().append(value)
+
+    def extend(self, values) -> None:
+        self.load().extend(values)
+
+    def insert(self, index: int, value) -> None:
+        self.load().insert(index, value)
+
+    def pop(self, index: int = -1) -> Any:
+        return self.load().pop(index)
+
+    def remove(self, value) -> None:
+        self.load().remove(value)
+
+    def sort(self, **kwargs) -> None:
+        self.load().sort(**kwargs)
+
+    def reverse(self) -> None:
+        self.load().reverse()
+
+    def clear(self) -> None:
+        self.load().clear()
+
+    def copy(self) -> List[Any]:
+        return list(self.load())
+
+
+def lazy_parse_all(relative_file: str, *args: str, should_strip: bool = True) -> List[LazyEntries]:
+    root = Path(os.path.abspath(relative_file)).parent
+
+    return [LazyEntries(root / file, should_strip=should_strip) for file in args]
+
+def lazy_parse_all_multiple_parts(relative_file: str, separator: str, expected_parts: int, *args: str, should_strip: bool = True) -> List[LazyEntries]:
+    root = Path(os.path.abspath(relative_file)).parent
+
+    return [LazyEntries(root / file, separator, expected_parts, should_strip=should_strip) for file in args]
+
+
+## Numeric inputs
+# Whole entries (or parts) of integers are parsed in one pass with NumPy, instead of int() on each line.
+# NumPy is only imported when they are called, importing this module stays cheap. dtype defaults to np.int64.
+# entry can be a list of lines, a text, or the Path of a file (a str is always a text, like in parse_cache).
+def entry_bytes(entry: Union[List[str], str, Path]) -> bytes:
+    if isinstance(entry, Path):
+        return entry.read_bytes()
+    if isinstance(entry, str):
+        return entry.encode()
+    return "".join(line + "\n" for line in entry).encode()
+
+# All the integers of a free text, like "Sensor at x=2, y=-18: closest beacon is at x=-2, y=15"
+def extract_integers(entry: Union[List[str], str, Path], signed: bool = True, dtype=None) -> "np.ndarray":
+    from aoc.common.mapped_entry import integer_runs
+    return integer_runs(entry_bytes(entry), signed, dtype)[0]
+
+# The integers of each line, as a (lines, columns) array, like "162,817,812" -> [162, 817, 812].
+# The separator regex is replaced by spaces before parsing: use it when a '-' is not a sign ("1-3").
+# Lines without integers are skipped.
+# With ragged, lines can have a different number of integers: it returns one array per line, so the result stays
+# aligned with the lines, and lines without integers give an empty array ("1 2", "", "3" -> [1, 2], [], [3]).
+def parse_array(entry: Union[List[str], str, Path], separator: Optional[str] = None, columns: Optional[int] = None,
+                ragged: bool = False, signed: bool = True, dtype=None) -> Union["np.ndarray", List["np.ndarray"]]:
+    import numpy as np
+    from aoc.common.mapped_entry import integer_runs
+
+    data = entry_bytes(entry)
+    if separator is not None:
+        data = re.sub(separator.encode(), b" ", data)
+    values, starts = integer_runs(data, signed, dtype)
+
+    # Line of each integer
+    newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord("\n"))
+    nb_lines = len(newlines) + (1 if len(data) > 0 and not data.endswith(b"\n") else 0)
+    counts = np.bincount(np.searchsorted(newlines, starts), minlength=nb_lines)
+    if ragged:
+        return np.split(values, np.cumsum(counts)[:-1]) if nb_lines > 0 else []
+
+    counts = counts[counts > 0]
+    if columns is None:
+        columns = int(counts[0]) if len(counts) > 0 else 0
+    if np.any(counts != columns):
+        raise ValueError(f"Expected {columns} integers per line, found {sorted(set(counts.tolist()))}")
+    return values.reshape(len(counts), columns)
@@ -1,113 +1,128 @@
 import itertools
 import math
 import numpy as np
+from operator import itemgetter
 from typing import Optional, Tuple, Callable
 
-class Point:
-    def __init__(self, x: int = 0, y: int = 0, z: int = 0):
-        self.x = x
-        self.y = y
-        self.z = z
+# Immutable 3D point, backed by a tuple (x, y, z).
+# Being a tuple, hash and == are done in C by the tuple implementation, and it has no __dict__.
+# Points are immutable: create a new Point instead of modifying x, y or z.
+# As == and hash are the ones of the tuple, a Point is equal to the tuple of its coordinates, with the same hash:
+# Point(1, 2) == (1, 2, 0), and Point2D(1, 2) == Point(1, 2). A dict or set mixing points and raw (x, y, z) tuples
+# sees them as the same key, don't mix them. A 2D tuple (1, 2) is never equal to a Point.
+class Point(tuple):
+    __slots__ = ()
+
+    def __new__(cls, x: int = 0, y: int = 0, z: int = 0):
+        return tuple.__new__(cls, (x, y, z))
+
+    x = property(itemgetter(0))
+    y = property(itemgetter(1))
+    z = property(itemgetter(2))
+
+    # Needed for copy and pickle, as the tuple version would give the whole tuple as the first argument
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def __copy__(self) -> "Point":
+        return self
+
+    def __deepcopy__(self, memo) -> "Point":
+        return self
 
     def __add__(self, other):
-        if type(other) is float or type(other) is int:
-            return Point(self.x + other, self.y + other, self.z + other)
-        elif isinstance(other, Point):
-            return Point(self.x + other.x, self.y + other.y, self.z + other.z)
-        else:
-            assert(False)
+        if isinstance(other, Point):
+            return _new_point(Point, (self[0] + other[0], self[1] + other[1], self[2] + other[2]))
+        return _new_point(Point, (self[0] + other, self[1] + other, self[2] + other))
 
     def __radd__(self, other):
         return self + other
 
     def __mul__(self, other):
-        if type(other) is float or type(other) is int:
-            return Point(self.x * other, self.y * other, self.z * other)
-        elif isinstance(other, Point):
-            return Point(self.x * other.x, self.y * other.y, self.z * other.z)
-        else:
-            assert(False)
+        if isinstance(other, Point):
+            return _new_point(Point, (self[0] * other[0], self[1] * other[1], self[2] * other[2]))
+        return _new_point(Point, (self[0] * other, self[1] * other, self[2] * other))
 
     def __rmul__(self, other):
         return self * other
 
     def __truediv__(self, other):
-        if type(other) is float or type(other) is int:
-            return Point(self.x / other, self.y / other, self.z / other)
-        elif isinstance(other, Point):
-            return Point(self.x / other.x, self.y / other.y, self.z / other.z)
-        else:
-            assert(False)
+        if isinstance(other, Point):
+            return _new_point(Point, (self[0] / other[0], self[1] / other[1], self[2] / other[2]))
+        return _new_point(Point, (self[0] / other, self[1] / other, self[2] / other))
 
     def __floordiv__(self, other):
-        if type(other) is float or type(other) is int:
-            return Point(self.x // other, self.y // other, self.z // other)
-        elif isinstance(other, Point):
-            return Point(self.x // other.x, self.y // other.y, self.z // other.z)
-        else:
-            assert(False)
+        if isinstance(other, Point):
+            return _new_point(Point, (self[0] // other[0], self[1] // other[1], self[2] // other[2]))
+        return _new_point(Point, (self[0] // other, self[1] // other, self[2] // other))
+
+    def __mod__(self, other):
+        if isinstance(other, Point):
+            return _new_point(Point, (self[0] % other[0], self[1] % other[1], self[2] % other[2]))
+        return _new_point(Point, (self[0] % other, self[1] % other, self[2] % other))
 
     def __sub__(self, other):
-        if type(other) is float or type(other) is int:
-            return Point(self.x - other, self.y - other, self.z - other)
-        elif isinstance(other, Point):
-            return Point(self.x - other.x, self.y - other.y, self.z - other.z)
-        else:
-            assert(False)
+        if isinstance(other, Point):
+            return _new_point(Point, (self[0] - other[0], self[1] - other[1], self[2] - other[2]))
+        return _new_point(Point, (self[0] - other, self[1] - other, self[2] - other))
 
     def __rsub__(self, other):
         return -self + other
     
     def __neg__(self):
-        return self * -1
-    
-    def __eq__(self, other: "Point") -> bool:
-        return self.x == other.x and self.y == other.y and self.z == other.z
-    
-    def __ne__(self, other: "Point") -> bool:
-        return not (self == other)
-    
+        return _new_point(Point, (-self[0], -self[1], -self[2]))
+
+    # __eq__, __ne__ and __hash__ are the tuple ones
+
     def __repr__(self) -> str:
-        return f"({self.x}, {self.y}, {self.z})"
-    
-    def __hash__(self) -> int:
-        return hash((self.x, self.y, self.z))
+        return f"({self[0]}, {self[1]}, {self[2]})"
     
     def __array__(self, dtype=None, copy=None) -> tuple:
-        return np.array((self.x, self.y, self.z), dtype=dtype, copy=copy)
+        return np.array(tuple(self), dtype=dtype, copy=copy)
+
+    # Copy with some of the components replaced
+    def replace(self, x: Optional[int] = None, y: Optional[int] = None, z: Optional[int] = None) -> "Point":
+        return Point(self[0] if x is None else x, self[1] if y is None else y, self[2] if z is None else z)
     
     def manathan_distance(self, other: "Point"):
-        return abs(self.x - other.x) + abs(self.y - other.y) + abs(self.z - other.z)
+        return abs(self[0] - other[0]) + abs(self[1] - other[1]) + abs(self[2] - other[2])
     
     def squared_distance(self, other: "Point"):
-        return (self.x - other.x) ** 2 + (self.y - other.y) ** 2 + (self.z - other.z) ** 2
+        return (self[0] - other[0]) ** 2 + (self[1] - other[1]) ** 2 + (self[2] - other[2]) ** 2
 
     def distance(self, other: "Point"):
         return math.sqrt(self.squared_distance(other))
     
     def distance_inf(self, other: "Point"):
-        return max(abs(self.x - other.x), abs(self.y - other.y), abs(self.z - other.z))
+        return max(abs(self[0] - other[0]), abs(self[1] - other[1]), abs(self[2] - other[2]))
     
+    # Not the tuple lexicographic order: a < b only if all the components are smaller
     def __lt__(self, other: "Point"):
-        return self.x < other.x and self.y < other.y and self.z < other.z
+        return self[0] < other[0] and self[1] < other[1] and self[2] < other[2]
     
     def __gt__(self, other: "Point"):
-        return self.x > other.x and self.y > other.y and self.z > other.z
+        return self[0] > other[0] and self[1] > other[1] and self[2] > other[2]
+
+    def __le__(self, other: "Point"):
+        return self[0] <= other[0] and self[1] <= other[1] and self[2] <= other[2]
+
+    def __ge__(self, other: "Point"):
+        return self[0] >= other[0] and self[1] >= other[1] and self[2] >= other[2]
     
     def dot(self, other: "Point") -> float:
-        return self.x * other.x + self.y * other.y + self.z * other.z
+        return self[0] * other[0] + self[1] * other[1] + self[2] * other[2]
     
     def __or__(self, other: "Point") -> float:
         return self.dot(other)
     
     def cross(self, other: "Point") -> "Point":
-        return Point(self.y * other.z - self.z * other.y, self.z * other.x - self.x * other.z, self.x * other.y - self.y * other.x)
+        return _new_point(Point, (self[1] * other[2] - self[2] * other[1], self[2] * other[0] - self[0] * other[2], self[0] * other[1] - self[1] * other[0]))
     
     def __xor__(self, other: "Point") -> "Point":
         return self.cross(other)
     
     def cross_2D(self, other: "Point") -> float:
-        return self.x * other.y - self.y * other.x
+        return self[0] * other[1] - self[1] * other[0]
     
     def squared_length(self) -> float:
         return self.dot(self)
@@ -115,21 +130,27 @@ class Point:
     def length(self) -> float:
         return math.sqrt(self.squared_length())
     
-    # Apply the result of the op between each x,y,z of self and other, in place
-    def apply_op_in_place(self, other: "Point", op: Callable):
-        self.x = op(self.x, other.x)
-        self.y = op(self.y, other.y)
-        self.z = op(self.z, other.z)
+    # Returns the result of the op between each x,y,z of self and other
+    def apply_op(self, other: "Point", op: Callable) -> "Point":
+        return Point(op(self[0], other[0]), op(self[1], other[1]), op(self[2], other[2]))
+
+# Skips Point.__new__ when we already have the 3 components
+_new_point = tuple.__new__
 
 class Point2D(Point):
-    def __init__(self, x = 0, y = 0):
-        super().__init__(x, y, 0)
+    __slots__ = ()
+
+    def __new__(cls, x = 0, y = 0):
+        return tuple.__new__(cls, (x, y, 0))
+
+    def __getnewargs__(self):
+        return (self[0], self[1])
 
     def __array__(self, dtype=None, copy=None):
-        return np.array((self.x, self.y), dtype=dtype, copy=copy)
+        return np.array((self[0], self[1]), dtype=dtype, copy=copy)
     
     def __repr__(self) -> str:
-        return f"({self.x}, {self.y})"
+        return f"({self[0]}, {self[1]})"
     
 up = Point(-1, 0)
 down = Point(1, 0)
@@ -1,4 +1,6 @@
-from typing import Optional, List
+import bisect
+import numpy as np
+from typing import Optional, List, Iterable, Iterator, Tuple, Union
 
 class Range:
     def __init__(self, min: int, max: int):
@@ -37,11 +39,17 @@ class Range:
         return self.min > other.min
 
     def __hash__(self):
-        return hash((self.x, self.y))
+        return hash((self.min, self.max))
         
+    def __eq__(self, other: "Range") -> bool:
+        if not isinstance(other, Range):
+            return NotImplemented
+        return self.min == other.min and self.max == other.max
+
     def __repr__(self):
         return f"{self.min}-{self.max}"
     
+    # For repeated inserts or queries, use an IntervalSet instead
     @staticmethod
     def reduce(ranges: List["Range"], inclusive: bool) -> List["Range"]:
         ranges = sorted(ranges)
@@ -54,3 +62,191 @@ class Range:
                 result.append(r)
 
         return result
+
+
+# Set of integers stored as sorted, disjoint and non adjacent inclusive intervals [min, max].
+# Intervals are merged on insert, so queries never need to sort or merge again.
+# Finding the intervals to update or to check is a bisect, O(log n).
+class IntervalSet:
+    def __init__(self, ranges: Iterable[Union[Range, Tuple[int, int]]] = ()) -> None:
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        for r in ranges:
+            if isinstance(r, Range):
+                self.add(r.min, r.max)
+            else:
+                self.add(*r)
+
+    def copy(self) -> "IntervalSet":
+        res = IntervalSet()
+        res.starts = self.starts.copy()
+        res.ends = self.ends.copy()
+        return res
+
+    # Add [min, max], merging it with the intervals it overlaps or touches
+    def add(self, min: int, max: int) -> None:
+        assert(min <= max)
+        # Intervals [i, j) overlap or touch [min, max]
+        i = bisect.bisect_left(self.ends, min - 1)
+        j = bisect.bisect_right(self.starts, max + 1)
+        if i < j:
+            min = self.starts[i] if self.starts[i] < min else min
+            max = self.ends[j - 1] if self.ends[j - 1] > max else max
+        self.starts[i:j] = [min]
+        self.ends[i:j] = [max]
+
+    # Remove [min, max] from the set
+    def remove(self, min: int, max: int) -> None:
+        assert(min <= max)
+        # Intervals [i, j) overlap [min, max]
+        i = bisect.bisect_left(self.ends, min)
+        j = bisect.bisect_right(self.starts, max)
+        if i >= j:
+            return
+
+        new_starts = []
+        new_ends = []
+        if self.starts[i] < min:
+            new_starts.append(self.starts[i])
+            new_ends.append(min - 1)
+        if self.ends[j - 1] > max:
+            new_starts.append(max + 1)
+            new_ends.append(self.ends[j - 1])
+        self.starts[i:j] = new_starts
+        self.ends[i:j] = new_ends
+
+    def contains(self, v: int) -> bool:
+        k = bisect.bisect_right(self.starts, v) - 1
+        return k >= 0 and v <= self.ends[k]
+
+    def __contains__(self, v: int) -> bool:
+        return self.contains(v)
+
+    # For each value, True if it is in the set
+    def contains_batch(self, values: Union[np.ndarray, Iterable[int]]) -> np.ndarray:
+        values = np.asarray(values, dtype=np.int64)
+        if len(self.starts) == 0:
+            return np.zeros(values.shape, dtype=bool)
+
+        k = np.searchsorted(np.array(self.starts, dtype=np.int64), values, side="right") - 1
+        ends = np.array(self.ends, dtype=np.int64)
+        return (k >= 0) & (values <= ends[np.maximum(k, 0)])
+
+    # Number of integers in the set
+    def total_length(self) -> int:
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    # Parts of [min, max] that are not in the set
+    def gaps(self, min: int, max: int) -> List[Range]:
+        res = []
+        curr = min
+        for k in range(bisect.bisect_left(self.ends, min), bisect.bisect_right(self.starts, max)):
+            if self.starts[k] > curr:
+                res.append(Range(curr, self.starts[k] - 1))
+            curr = self.ends[k] + 1
+        if curr <= max:
+            res.append(Range(curr, max))
+        return res
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        res = self.copy()
+        for r in other:
+            res.add(r.min, r.max)
+        return res
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        res = self.copy()
+        for r in other:
+            res.remove(r.min, r.max)
+        return res
+
+    def __eq__(self, other: "IntervalSet") -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    # Number of intervals
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Range]:
+        for start, end in zip(self.starts, self.ends):
+            yield Range(start, end)
+
+    def __repr__(self) -> str:
+        return "{" + ", ".join(f"{start}-{end}" for start, end in zip(self.starts, self.ends)) + "}"
+
+
+# Piecewise offset mapping on integers: x in [min, max] of a segment maps to x + offset,
+# and x outside of all the segments maps to itself (like the almanac maps of 2023/Day05).
+# Whole intervals are mapped by splitting them at the segment boundaries, so the cost depends
+# on the number of segments, not on the size of the intervals.
+class OffsetMap:
+    def __init__(self, segments: Iterable[Tuple[int, int, int]] = ()) -> None:
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        self.offsets: List[int] = []
+        for min, max, offset in segments:
+            self.add(min, max, offset)
+
+    # Map [min, max] to [min + offset, max + offset]. Segments can't overlap.
+    def add(self, min: int, max: int, offset: int) -> None:
+        assert(min <= max)
+        i = bisect.bisect_left(self.ends, min)
+        assert(i == len(self.starts) or self.starts[i] > max)
+        self.starts.insert(i, min)
+        self.ends.insert(i, max)
+        self.offsets.insert(i, offset)
+
+    def __call__(self, x: int) -> int:
+        k = bisect.bisect_right(self.starts, x) - 1
+        if k >= 0 and x <= self.ends[k]:
+            return x + self.offsets[k]
+        return x
+
+    # Cut [min, max] at the segment boundaries: list of (min, max, offset), in order, covering [min, max].
+    # Parts outside of all the segments have an offset of 0.
+    def split(self, min: int, max: int) -> List[Tuple[int, int, int]]:
+        res = []
+        curr = min
+        for k in range(bisect.bisect_left(self.ends, min), bisect.bisect_right(self.starts, max)):
+            if self.starts[k] > curr:
+                res.append((curr, self.starts[k] - 1, 0))
+                curr = self.starts[k]
+            end = self.ends[k] if self.ends[k] < max else max
+            res.append((curr, end, self.offsets[k]))
+            curr = end + 1
+        if curr <= max:
+            res.append((curr, max, 0))
+        return res
+
+    # Image of [min, max]
+    def map_range(self, min: int, max: int) -> IntervalSet:
+        return IntervalSet((a + offset, b + offset) for a, b, offset in self.split(min, max))
+
+    # Image of all the intervals of a set
+    def map_set(self, intervals: IntervalSet) -> IntervalSet:
+        res = IntervalSet()
+        for r in intervals:
+            for a, b, offset in self.split(r.min, r.max):
+                res.add(a + offset, b + offset)
+        return res
+
+    # Single map equivalent to applying self, then other: res(x) = other(self(x))
+    def then(self, other: "OffsetMap") -> "OffsetMap":
+        if len(self.starts) == 0 and len(other.starts) == 0:
+            return OffsetMap()
+
+        # Outside of [first, last] both maps are the identity, so the result is too
+        first = min(self.starts[:1] + other.starts[:1])
+        last = max(self.ends[-1:] + other.ends[-1:])
+
+        res = OffsetMap()
+        for a, b, offset in self.split(first, last):
+            for c, d, other_offset in other.split(a + offset, b + offset):
+                if offset + other_offset != 0:
+                    res.add(c - offset, d - offset, offset + other_offset)
+        return res
+
+    def __repr__(self) -> str:
+        return "{" + ", ".join(f"{start}-{end}: {offset:+}" for start, end, offset in zip(self.starts, self.ends, self.offsets)) + "}"
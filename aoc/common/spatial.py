@@ -0,0 +1,89 @@
+import numpy as np
+from typing import Generator, Iterable, Tuple, Union
+from aoc.common.vector import VectorArray
+
+# Pairwise distances between the points of a point cloud, without building a Python object per pair.
+# Pairs (i, j) with i < j are stored in a "condensed" array, in row-major order:
+# (0, 1), (0, 2), ..., (0, n-1), (1, 2), ..., (n-2, n-1), like scipy.spatial.distance.pdist.
+
+Points = Union[np.ndarray, VectorArray, Iterable[Iterable[int]]]
+
+# Max number of elements of the temporary (rows, n, dim) array used to compute a chunk of rows
+chunk_max_elements = 1 << 22
+
+
+def as_array(points: Points) -> np.ndarray:
+    if isinstance(points, VectorArray):
+        return points.values
+    if isinstance(points, np.ndarray):
+        return points
+    return np.array([tuple(p) for p in points])
+
+
+def nb_pairs(n: int) -> int:
+    return n * (n - 1) // 2
+
+
+# Squared distance of each pair (i, j), i < j, in condensed order.
+# Computed by chunks of rows, so the temporary memory stays bounded whatever the number of points.
+def pairwise_squared_distances(points: Points) -> np.ndarray:
+    points = as_array(points)
+    n, dim = points.shape
+    res = np.empty(nb_pairs(n), dtype=np.result_type(points.dtype, np.int64))
+    chunk_size = max(1, chunk_max_elements // max(1, n * dim))
+
+    offset = 0
+    for start in range(0, n, chunk_size):
+        end = min(n, start + chunk_size)
+        diff = points[start:end, None, :] - points[None, :, :]
+        block = (diff * diff).sum(axis=2)
+        # Only keep j > i
+        mask = np.arange(n)[None, :] > np.arange(start, end)[:, None]
+        values = block[mask]
+        res[offset:offset + len(values)] = values
+        offset += len(values)
+
+    return res
+
+
+# Convert condensed indexes (int or array) to the (i, j) pairs, for n points
+def condensed_to_pair(k: Union[int, np.ndarray], n: int) -> Tuple[Union[int, np.ndarray], Union[int, np.ndarray]]:
+    rows = np.arange(n - 1)
+    row_starts = rows * (2 * n - rows - 1) // 2
+    i = np.searchsorted(row_starts, k, side="right") - 1
+    j = k - row_starts[i] + i + 1
+    if np.ndim(k) == 0:
+        return int(i), int(j)
+    return i, j
+
+
+# Lazily yields (i, j, squared_distance) for all pairs, from the closest to the farthest.
+# Pairs with the same distance come in condensed order (i then j), as a stable sort would give.
+# Only the pairs that are consumed are sorted: each batch is found with a partial sort (O(n²)),
+# and the batch size doubles each time, so stopping early is cheap.
+def closest_pairs(points: Points, batch_size: int = 1024) -> Generator[Tuple[int, int, int]]:
+    points = as_array(points)
+    n = len(points)
+    distances = pairwise_squared_distances(points)
+    if np.issubdtype(distances.dtype, np.integer):
+        consumed = np.iinfo(distances.dtype).max
+    else:
+        consumed = np.inf
+
+    remaining = len(distances)
+    while remaining > 0:
+        k = min(batch_size, remaining)
+        threshold = np.partition(distances, k - 1)[k - 1]
+        # All the pairs up to the threshold, ties included, so batches never split equal distances
+        batch = np.flatnonzero(distances <= threshold)
+        batch_distances = distances[batch]
+        order = np.lexsort((batch, batch_distances))
+        batch = batch[order]
+        batch_distances = batch_distances[order]
+        distances[batch] = consumed
+        remaining -= len(batch)
+
+        i, j = condensed_to_pair(batch, n)
+        yield from zip(i.tolist(), j.tolist(), batch_distances.tolist())
+
+        batch_size *= 2
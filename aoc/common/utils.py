@@ -1,15 +1,149 @@
+import atexit
+import contextlib
+import csv
+import functools
+import json
+import math
+import os
 import time
+import tracemalloc
+from typing import Any, Dict, Iterator, List, Optional
 
 def is_digit(c: str) -> bool:
     return ord('0') <= ord(c) <= ord('9')
 
+
+## Profiling
+# Options, can be set with environment variables:
+# AOC_PROFILE_QUIET=1: don't print "Func X took Nms" after each call
+# AOC_PROFILE_MEMORY=1: record the peak memory of each call with tracemalloc (slows down the code)
+# AOC_PROFILE_OUTPUT=path.json or path.csv: dump all the stats in this file at exit
+profile_options = {
+    "quiet": os.environ.get("AOC_PROFILE_QUIET", "") not in ("", "0"),
+    "memory": os.environ.get("AOC_PROFILE_MEMORY", "") not in ("", "0"),
+    "output": os.environ.get("AOC_PROFILE_OUTPUT") or None,
+}
+
+
+# Timings of all the calls of a function or a scope, in ms
+class ProfileStats:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.timings: List[float] = []
+        self.peak_memory: Optional[int] = None
+
+    def add(self, duration: float, peak_memory: Optional[int] = None) -> None:
+        self.timings.append(duration)
+        if peak_memory is not None:
+            self.peak_memory = peak_memory if self.peak_memory is None else max(self.peak_memory, peak_memory)
+
+    @property
+    def calls(self) -> int:
+        return len(self.timings)
+
+    @property
+    def total(self) -> float:
+        return sum(self.timings)
+
+    @property
+    def min(self) -> float:
+        return min(self.timings)
+
+    @property
+    def max(self) -> float:
+        return max(self.timings)
+
+    # Nearest-rank percentile, p in [0, 100]
+    def percentile(self, p: float) -> float:
+        timings = sorted(self.timings)
+        return timings[max(0, math.ceil(p / 100 * len(timings)) - 1)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "total_ms": self.total,
+            "min_ms": self.min,
+            "max_ms": self.max,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "peak_memory": self.peak_memory,
+        }
+
+
+# Stats of every profiled function or scope, by name.
+# Nested scopes are named after their parents: "outer > inner".
+profile_stats: Dict[str, ProfileStats] = {}
+# Names of the functions and scopes currently running
+profile_stack: List[str] = []
+
+
+def reset_profile() -> None:
+    profile_stats.clear()
+
+
+@contextlib.contextmanager
+def profile_scope(name: str, verbose: bool = True) -> Iterator[None]:
+    # Recursive calls are part of the outermost one
+    if name in profile_stack:
+        yield
+        return
+
+    full_name = " > ".join(profile_stack + [name])
+    memory = profile_options["memory"]
+    if memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        # Peak is global: only reset it for outermost scopes, so an inner scope doesn't hide the peak of its parent
+        if len(profile_stack) == 0:
+            tracemalloc.reset_peak()
+
+    profile_stack.append(name)
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = (time.perf_counter() - start_time) * 1000
+        profile_stack.pop()
+        peak_memory = tracemalloc.get_traced_memory()[1] if memory else None
+
+        if full_name not in profile_stats:
+            profile_stats[full_name] = ProfileStats(full_name)
+        profile_stats[full_name].add(duration, peak_memory)
+
+        if verbose and not profile_options["quiet"]:
+            print(f"Func {name} took {duration}ms")
+
+
 def profile(func):
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.perf_counter()
-        res = func(*args, **kwargs)
-        end_time = time.perf_counter()
+        with profile_scope(func.__name__):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def dump_profile_json(path: str) -> None:
+    with open(path, "w") as f:
+        json.dump([stats.to_dict() for stats in profile_stats.values()], f, indent=4)
+
+
+def dump_profile_csv(path: str) -> None:
+    rows = [stats.to_dict() for stats in profile_stats.values()]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if len(rows) > 0 else [])
+        writer.writeheader()
+        writer.writerows(rows)
+
 
-        print(f"Func {func.__name__} took {(end_time - start_time) * 1000}ms")
+@atexit.register
+def dump_profile() -> None:
+    path = profile_options["output"]
+    if path is None or len(profile_stats) == 0:
+        return
 
-        return res
-    return wrapper
\ No newline at end of file
+    if path.endswith(".csv"):
+        dump_profile_csv(path)
+    else:
+        dump_profile_json(path)
@@ -1,6 +1,7 @@
 import itertools
 import math
-from typing import Optional, Tuple, Callable, Generator, Union, List
+import numpy as np
+from typing import Optional, Tuple, Callable, Generator, Union, List, Iterable
 
 Numeric = Union[int, float]
 NumericOrVector = Union[Numeric, "Vector"]
@@ -195,3 +196,168 @@ class Vector4(Vector):
     @staticmethod
     def cast(other: "Vector") -> "Vector4":
         return Vector4(other.x, other.y, other.z, other.w)
+
+
+# N vectors of the same dimension stored in a single (N, dim) numpy array.
+# All the operations are done on all the vectors at once, and broadcast with a number, a Vector or another VectorArray.
+# Operations that give a number per vector (dot, distances, comparisons, ...) return a numpy array of size N.
+class VectorArray:
+    def __init__(self, values: Union[np.ndarray, Iterable[Iterable[Numeric]]]) -> None:
+        if not isinstance(values, np.ndarray):
+            values = np.array([list(v.values) if isinstance(v, Vector) else list(v) for v in values])
+        assert(values.ndim == 2 and 2 <= values.shape[1] <= 4)
+        self.values = values
+
+    @staticmethod
+    def from_vectors(vectors: Iterable[Vector], dtype=None) -> "VectorArray":
+        return VectorArray(np.array([v.values for v in vectors], dtype=dtype))
+
+    def to_vectors(self) -> List[Vector]:
+        vector_class = _vector_classes[self.dim]
+        return [vector_class(*v) for v in self.values.tolist()]
+
+    @property
+    def dim(self) -> int:
+        return self.values.shape[1]
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    # An int returns a single Vector, anything else (slice, array of indexes, mask) returns a VectorArray
+    def __getitem__(self, idx) -> Union[Vector, "VectorArray"]:
+        if isinstance(idx, (int, np.integer)):
+            return _vector_classes[self.dim](*self.values[idx].tolist())
+        return VectorArray(self.values[idx])
+
+    def __iter__(self) -> Generator[Vector]:
+        yield from self.to_vectors()
+
+    # Column of a component. Like Vector, an invalid component (like z on Vec2) gives 0
+    def component(self, idx: int) -> np.ndarray:
+        if idx < self.dim:
+            return self.values[:, idx]
+        return np.zeros(len(self), dtype=self.values.dtype)
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.component(0)
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.component(1)
+
+    @property
+    def z(self) -> np.ndarray:
+        return self.component(2)
+
+    @property
+    def w(self) -> np.ndarray:
+        return self.component(3)
+
+    ## Utilities
+    # Convert other to something that broadcasts with self.values
+    def other_values(self, other: Union[NumericOrVector, "VectorArray", np.ndarray]) -> Union[Numeric, np.ndarray]:
+        if isinstance(other, VectorArray):
+            return other.values
+        elif isinstance(other, Vector):
+            return np.array([other[i] for i in range(self.dim)])
+        elif isinstance(other, np.ndarray) and other.ndim == 1 and len(other) == len(self):
+            # One number per vector
+            return other[:, None]
+        return other
+
+    ## Maths operations and overloads
+    def __add__(self, other) -> "VectorArray":
+        return VectorArray(self.values + self.other_values(other))
+
+    def __radd__(self, other) -> "VectorArray":
+        return self + other
+
+    def __mul__(self, other) -> "VectorArray":
+        return VectorArray(self.values * self.other_values(other))
+
+    def __rmul__(self, other) -> "VectorArray":
+        return self * other
+
+    def __sub__(self, other) -> "VectorArray":
+        return VectorArray(self.values - self.other_values(other))
+
+    def __rsub__(self, other) -> "VectorArray":
+        return -self + other
+
+    def __truediv__(self, other) -> "VectorArray":
+        return VectorArray(self.values / self.other_values(other))
+
+    def __floordiv__(self, other) -> "VectorArray":
+        return VectorArray(self.values // self.other_values(other))
+
+    def __neg__(self) -> "VectorArray":
+        return VectorArray(-self.values)
+
+    def __repr__(self) -> str:
+        return f"VectorArray({self.values.tolist()})"
+
+    ## Distances
+    def manathan_distance(self, other) -> np.ndarray:
+        return np.abs(self.values - self.other_values(other)).sum(axis=1)
+
+    def squared_distance(self, other) -> np.ndarray:
+        return ((self.values - self.other_values(other)) ** 2).sum(axis=1)
+
+    def distance(self, other) -> np.ndarray:
+        return np.sqrt(self.squared_distance(other))
+
+    def distance_inf(self, other) -> np.ndarray:
+        return np.abs(self.values - self.other_values(other)).max(axis=1)
+
+    ## Comparison overloads, True for a vector if it is True for all its components
+    def __eq__(self, other) -> np.ndarray:
+        return (self.values == self.other_values(other)).all(axis=1)
+
+    def __ne__(self, other) -> np.ndarray:
+        return ~(self == other)
+
+    def __lt__(self, other) -> np.ndarray:
+        return (self.values < self.other_values(other)).all(axis=1)
+
+    def __le__(self, other) -> np.ndarray:
+        return (self.values <= self.other_values(other)).all(axis=1)
+
+    def __gt__(self, other) -> np.ndarray:
+        return (self.values > self.other_values(other)).all(axis=1)
+
+    def __ge__(self, other) -> np.ndarray:
+        return (self.values >= self.other_values(other)).all(axis=1)
+
+    # Mutable and compared element wise, so not hashable
+    __hash__ = None
+
+    ## Algebra operations
+    def dot(self, other) -> np.ndarray:
+        return (self.values * self.other_values(other)).sum(axis=1)
+
+    def __or__(self, other) -> np.ndarray:
+        return self.dot(other)
+
+    # Cross is defined for Vec2 (returns a number per vector) or Vec3 (returns a VectorArray)
+    def cross(self, other) -> Union[np.ndarray, "VectorArray"]:
+        if self.dim == 2:
+            return self.cross_2D(other)
+        assert(self.dim == 3)
+        return VectorArray(np.cross(self.values, self.other_values(other)))
+
+    def __xor__(self, other) -> Union[np.ndarray, "VectorArray"]:
+        return self.cross(other)
+
+    def cross_2D(self, other) -> np.ndarray:
+        other = np.broadcast_to(self.other_values(other), self.values.shape)
+        return self.values[:, 0] * other[:, 1] - self.values[:, 1] * other[:, 0]
+
+    def squared_length(self) -> np.ndarray:
+        return self.dot(self)
+
+    def length(self) -> np.ndarray:
+        return np.sqrt(self.squared_length())
+
+
+_vector_classes = {2: Vector2, 3: Vector3, 4: Vector4}
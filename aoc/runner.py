@@ -0,0 +1,186 @@
+# Run and time many solutions at once.
+# Solutions are found from the folder layout: aoc/<year>/Day<N>/solution.py and everybody_codes/<year>/Quest<N>/solution.py
+# Each solution is run as __main__ (its output is hidden unless --verbose), and its @profile timings are collected.
+# With --part, only the selected parts run instead: the solution is imported, and its part_one / part_two functions are
+# called on example_entries then entries (solutions that don't follow this layout fail). Everybody Codes quests have
+# one input per part: part N gets entries[N - 1].
+# Examples, from the root of the repository:
+#   python -m aoc.runner --year 2024                        Every day of 2024
+#   python -m aoc.runner --year 2024 --day 6 12 --verbose   2024/Day6 and 2024/Day12, with their output
+#   python -m aoc.runner --event everybody_codes --processes 8 --sort name
+#   python -m aoc.runner --year 2023 --part 2                Only part two of every day of 2023
+import argparse
+import concurrent.futures
+import contextlib
+import functools
+import importlib.util
+import io
+import runpy
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from aoc.common import utils
+from aoc.common.multithread import close_pools
+
+root = Path(__file__).resolve().parent.parent
+
+# Event -> prefix of the day folders
+events = {"aoc": "Day", "everybody_codes": "Quest"}
+
+
+class Solution:
+    def __init__(self, event: str, year: int, day: int, path: Path) -> None:
+        self.event = event
+        self.year = year
+        self.day = day
+        self.path = path
+
+    @property
+    def name(self) -> str:
+        return f"{self.event}/{self.year}/{events[self.event]}{self.day}"
+
+
+def discover(event_names: Optional[List[str]] = None, years: Optional[List[int]] = None, days: Optional[List[int]] = None) -> List[Solution]:
+    res = []
+    for event, prefix in events.items():
+        if event_names is not None and event not in event_names:
+            continue
+        event_folder = root / event
+        for year_folder in event_folder.iterdir():
+            if not year_folder.is_dir() or not year_folder.name.isnumeric():
+                continue
+            year = int(year_folder.name)
+            if years is not None and year not in years:
+                continue
+            for day_folder in year_folder.iterdir():
+                day = day_folder.name[len(prefix):]
+                if not day_folder.name.startswith(prefix) or not day.isnumeric() or not (day_folder / "solution.py").exists():
+                    continue
+                if days is not None and int(day) not in days:
+                    continue
+                res.append(Solution(event, year, int(day), day_folder / "solution.py"))
+
+    return sorted(res, key=lambda s: (s.event, s.year, s.day))
+
+
+part_functions = {1: "part_one", 2: "part_two", 3: "part_three"}
+
+
+# Imports the solution (its __main__ block doesn't run), and runs the given parts like its __main__ block would
+def run_parts(solution: Solution, parts: List[int]) -> None:
+    spec = importlib.util.spec_from_file_location("solution", solution.path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered while it runs, so the workers of its pools can find its functions
+    sys.modules["solution"] = module
+    try:
+        spec.loader.exec_module(module)
+        # Parts the solution doesn't have are skipped (AoC has no part three), but it needs at least one of them
+        funcs = [(part, getattr(module, part_functions[part])) for part in parts if hasattr(module, part_functions[part])]
+        if len(funcs) == 0:
+            raise AttributeError(f"{solution.name} has none of {', '.join(part_functions[part] for part in parts)}")
+        for part, func in funcs:
+            for entries, label in (("example_entries", "example"), ("entries", "entry")):
+                if not hasattr(module, entries):
+                    continue
+                entry = getattr(module, entries)
+                if solution.event == "everybody_codes":
+                    entry = entry[part - 1]
+                print(f"Part {part} {label}:", func(entry))
+    finally:
+        del sys.modules["solution"]
+
+
+# Runs a solution as __main__, or only the given parts, and returns (name, total time in ms, profile stats, output, error)
+def run_solution(solution: Solution, verbose: bool = False, parts: Optional[List[int]] = None) -> Tuple[str, float, List[Dict[str, Any]], str, Optional[str]]:
+    utils.reset_profile()
+    output = io.StringIO()
+    error = None
+    start_time = time.perf_counter()
+    # Like when running the solution directly, its folder is the first place to import from
+    sys.path.insert(0, str(solution.path.parent))
+    try:
+        with contextlib.redirect_stdout(sys.stdout if verbose else output):
+            if parts is None:
+                runpy.run_path(str(solution.path), run_name="__main__")
+            else:
+                run_parts(solution, parts)
+    except Exception:
+        error = traceback.format_exc(limit=-3)
+    finally:
+        sys.path.remove(str(solution.path.parent))
+        # Their workers only know this solution
+        close_pools()
+    duration = (time.perf_counter() - start_time) * 1000
+    stats = [stats.to_dict() for stats in utils.profile_stats.values()]
+    return solution.name, duration, stats, output.getvalue(), error
+
+
+columns = ["solution", "function", "calls", "total_ms", "min_ms", "max_ms", "p90_ms"]
+
+
+def summary_rows(results: List[Tuple[str, float, List[Dict[str, Any]], str, Optional[str]]], functions: Optional[List[str]]) -> List[Dict[str, Any]]:
+    rows = []
+    for name, duration, stats, _, error in results:
+        if error is not None:
+            rows.append({"solution": name, "function": "ERROR", "calls": 0, "total_ms": duration, "min_ms": 0, "max_ms": 0, "p90_ms": 0})
+            continue
+        for s in stats:
+            if functions is not None and s["name"].split(" > ")[-1] not in functions:
+                continue
+            rows.append({"solution": name, "function": s["name"], **{c: s[c] for c in columns[2:]}})
+        rows.append({"solution": name, "function": "(whole run)", "calls": 1, "total_ms": duration, "min_ms": duration, "max_ms": duration, "p90_ms": duration})
+    return rows
+
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    cells = [columns] + [[f"{row[c]:.1f}" if isinstance(row[c], float) else str(row[c]) for c in columns] for row in rows]
+    widths = [max(len(line[i]) for line in cells) for i in range(len(columns))]
+    lines = []
+    for k, line in enumerate(cells):
+        lines.append("  ".join(cell.ljust(width) if i < 2 else cell.rjust(width) for i, (cell, width) in enumerate(zip(line, widths))))
+        if k == 0:
+            lines.append("  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run and time the solutions")
+    parser.add_argument("--event", nargs="*", choices=list(events.keys()), help="Events to run (default: all)")
+    parser.add_argument("--year", nargs="*", type=int, help="Years to run (default: all)")
+    parser.add_argument("--day", nargs="*", type=int, help="Days (or quests) to run (default: all)")
+    parser.add_argument("--part", nargs="*", type=int, choices=list(part_functions.keys()), help="Only run these parts (default: the whole __main__ of the solutions)")
+    parser.add_argument("--function", nargs="*", help="Only show these profiled functions in the summary, like part_one or solve (display only)")
+    parser.add_argument("--processes", type=int, default=1, help="Run the solutions in a pool of processes")
+    parser.add_argument("--sort", choices=["time", "name"], default="name", help="Sort the summary by time (slowest first) or name")
+    parser.add_argument("--verbose", action="store_true", help="Show the output of the solutions (only without --processes)")
+    args = parser.parse_args(argv)
+
+    solutions = discover(args.event, args.year, args.day)
+    if len(solutions) == 0:
+        print("No solution found")
+        return
+
+    # Timings are in the summary, don't print them after each call
+    utils.profile_options["quiet"] = True
+    if args.processes > 1:
+        # Not a multiprocessing Pool: its workers are daemonic, and can't start the pools some solutions use
+        with concurrent.futures.ProcessPoolExecutor(args.processes) as executor:
+            results = list(executor.map(functools.partial(run_solution, verbose=False, parts=args.part), solutions))
+    else:
+        results = [run_solution(s, args.verbose, args.part) for s in solutions]
+
+    for name, _, _, _, error in results:
+        if error is not None:
+            print(f"{name} failed:\n{error}")
+
+    rows = summary_rows(results, args.function)
+    if args.sort == "time":
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    print(format_table(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# Compare the A* frontier backends (see aoc.common.astar.FrontierType) on the puzzles using AStar_Solver.
+# Run from the root of the repository: python benchmarks/astar_frontiers.py
+import importlib.util
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+root = Path(os.path.abspath(__file__)).parent.parent
+sys.path.insert(0, str(root))
+
+from aoc.common.astar import AStar_Solver, FrontierType
+from aoc.common.grid import Grid
+from aoc.common.point import Point
+
+nb_runs = 3
+
+
+def load_solution(year: int, day: int) -> Any:
+    path = root / "aoc" / str(year) / f"Day{day}" / "solution.py"
+    spec = importlib.util.spec_from_file_location(f"aoc_{year}_day{day}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def parse_maze(entry: List[str]) -> Tuple[Grid, Point, Point]:
+    grid = []
+    start = None
+    end = None
+    for i, line in enumerate(entry):
+        grid.append([])
+        for j, c in enumerate(line):
+            if c == "S":
+                start = Point(i, j)
+            elif c == "E":
+                end = Point(i, j)
+            grid[-1].append(c != "#")
+    return Grid(grid), start, end
+
+
+def clumsy_crucible(min_straight: int, max_straight: int) -> Callable[[], AStar_Solver]:
+    module = load_solution(2023, 17)
+
+    def create() -> AStar_Solver:
+        module.State.min_straight = min_straight
+        module.State.max_straight = max_straight
+        return module.ClumsyCrucible(module.entries)
+    return create
+
+
+def reindeer_maze() -> Callable[[], AStar_Solver]:
+    module = load_solution(2024, 16)
+    grid, start, end = parse_maze(module.entries)
+    return lambda: module.ReindeerMaze(grid, start, end)
+
+
+def corrupted_bytes() -> Callable[[], AStar_Solver]:
+    module = load_solution(2024, 18)
+    corrupted = set()
+    end = Point(0, 0)
+    for line in module.entries[:1024]:
+        y, x = line.split(",")
+        corrupted.add(Point(int(x), int(y)))
+        end = Point(max(end.x, int(x)), max(end.y, int(y)))
+    return lambda: module.CorruptedBytes(corrupted, Point(0, 0), end)
+
+
+def program_race() -> Callable[[], AStar_Solver]:
+    module = load_solution(2024, 20)
+    grid, start, end = parse_maze(module.entries)
+    return lambda: module.ProgramRace(grid, start, end)
+
+
+def run(create: Callable[[], AStar_Solver], frontier_type: FrontierType, solve: Callable[[AStar_Solver], Any]) -> Tuple[Any, float]:
+    best = None
+    result = None
+    for _ in range(nb_runs):
+        solver = create()
+        solver.frontier_type = frontier_type
+        start_time = time.perf_counter()
+        result = solve(solver)
+        elapsed = time.perf_counter() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+if __name__ == "__main__":
+    path_length = lambda solver: len(solver.solve())
+    puzzles = [
+        ("2023/Day17 part 1", clumsy_crucible(0, 3), lambda solver: solver.solve()),
+        ("2023/Day17 part 2", clumsy_crucible(4, 10), lambda solver: solver.solve()),
+        ("2024/Day16 part 1", reindeer_maze(), lambda solver: solver.solve()),
+        ("2024/Day16 part 2", reindeer_maze(), lambda solver: solver.solve(True)),
+        ("2024/Day18 part 1", corrupted_bytes(), path_length),
+        ("2024/Day20 best path", program_race(), path_length),
+    ]
+    frontier_types = [FrontierType.PriorityQueue, FrontierType.Heap, FrontierType.Bucket]
+
+    print(f"{'Puzzle':<22}" + "".join(f"{t.name:>15}" for t in frontier_types))
+    for name, create, solve in puzzles:
+        results = [run(create, t, solve) for t in frontier_types]
+        assert all(r[0] == results[0][0] for r in results), f"{name}: frontiers disagree {[r[0] for r in results]}"
+        print(f"{name:<22}" + "".join(f"{r[1] * 1000:>13.1f}ms" for r in results))
@@ -0,0 +1,67 @@
+# Benchmark of aoc.common.mapped_entry against parse_entry, on synthetic inputs scaled up from 2024/Day9 (one line
+# disk map) and 2024/Day22 (one buyer seed per line).
+# Run from the root of the repository: python benchmarks/mapped_entry.py [size in MB]
+import os
+import random
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+root = Path(os.path.abspath(__file__)).parent.parent
+sys.path.insert(0, str(root))
+
+import numpy as np
+from aoc.common.mapped_entry import MappedEntry
+from aoc.common.parse_entry import parse_entry
+
+
+def write_inputs(folder: Path, size: int):
+    disk_map = folder / "disk_map.txt"
+    with disk_map.open("w") as f:
+        f.write("".join(random.choices("0123456789", k=size)) + "\n")
+
+    buyers = folder / "buyers.txt"
+    with buyers.open("w") as f:
+        # About 8 bytes per seed
+        f.write("\n".join(str(random.randrange(1, 16777216)) for _ in range(size // 8)) + "\n")
+    return disk_map, buyers
+
+
+def timed(name: str, func):
+    start_time = timeit.default_timer()
+    result = func()
+    print(f"{name:<40}{(timeit.default_timer() - start_time) * 1000:>10.1f}ms")
+    return result
+
+
+def disk_map_parse_entry(path: Path) -> np.ndarray:
+    return np.array([int(c) for c in parse_entry(path)[0]], dtype=np.int8)
+
+
+def disk_map_mapped(path: Path) -> np.ndarray:
+    with MappedEntry(path) as entry:
+        return entry.digits()
+
+
+def buyers_parse_entry(path: Path) -> np.ndarray:
+    return np.array([int(e) for e in parse_entry(path)], dtype=np.int64)
+
+
+def buyers_mapped(path: Path) -> np.ndarray:
+    with MappedEntry(path) as entry:
+        return entry.to_array()
+
+
+if __name__ == "__main__":
+    size = int(float(sys.argv[1]) * 1024 * 1024) if len(sys.argv) > 1 else 32 * 1024 * 1024
+    with tempfile.TemporaryDirectory() as folder:
+        disk_map, buyers = write_inputs(Path(folder), size)
+
+        expected = timed("disk map: parse_entry + int", lambda: disk_map_parse_entry(disk_map))
+        result = timed("disk map: MappedEntry.digits", lambda: disk_map_mapped(disk_map))
+        assert np.array_equal(expected, result)
+
+        expected = timed("buyers: parse_entry + int", lambda: buyers_parse_entry(buyers))
+        result = timed("buyers: MappedEntry.to_array", lambda: buyers_mapped(buyers))
+        assert np.array_equal(expected, result)
@@ -0,0 +1,51 @@
+# Micro-benchmark of aoc.common.point.Point, and of 2024/Day6 which uses Points as set keys on every step.
+# Run from the root of the repository: python benchmarks/point.py
+import os
+import sys
+import timeit
+from pathlib import Path
+
+root = Path(os.path.abspath(__file__)).parent.parent
+sys.path.insert(0, str(root))
+
+from aoc.common.point import Point
+from astar_frontiers import load_solution
+
+nb_runs = 5
+
+
+def micro_benchmarks() -> None:
+    a = Point(3, 4)
+    b = Point(-1, 2)
+    states = set()
+    benchmarks = [
+        ("Point(x, y)", lambda: Point(3, 4)),
+        ("a + b", lambda: a + b),
+        ("a - b", lambda: a - b),
+        ("a * 3", lambda: a * 3),
+        ("a == b", lambda: a == b),
+        ("hash(a)", lambda: hash(a)),
+        ("(a, 1) in set", lambda: (a, 1) in states),
+        ("a.manathan_distance(b)", lambda: a.manathan_distance(b)),
+    ]
+    number = 200000
+    for name, func in benchmarks:
+        best = min(timeit.repeat(func, number=number, repeat=nb_runs))
+        print(f"{name:<24}{best / number * 1e9:>10.1f}ns")
+
+
+def day6_benchmark() -> None:
+    module = load_solution(2024, 6)
+    result = None
+    best = None
+    for _ in range(nb_runs):
+        start_time = timeit.default_timer()
+        result = module.solve(module.entries)
+        elapsed = timeit.default_timer() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{'2024/Day6 solve':<24}{best * 1000:>10.1f}ms {result}")
+
+
+if __name__ == "__main__":
+    micro_benchmarks()
+    day6_benchmark()
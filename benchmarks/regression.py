@@ -0,0 +1,135 @@
+# Regression benchmark of the solutions, against a baseline stored in benchmarks/baseline.json.
+# Each selected solution is run (see aoc.runner) warmup + runs times. For the whole run and for each @profile function,
+# the median and the interquartile range of the timings are kept, along with the answers of the solution: the lines of
+# its output starting like "Part 1 entry:" or "First answer:" (all the lines if none does), so progress or debug lines
+# are not compared.
+# The committed baseline.json holds 2025, recorded on a single core machine: answers are comparable anywhere, timings
+# only on the same machine, record your own with --update before comparing timings.
+# Run from the root of the repository:
+#   python benchmarks/regression.py --year 2025 --update       Record the baseline of 2025
+#   python benchmarks/regression.py --year 2025                Compare with the baseline
+# Comparing fails (exit code 1) if an answer changed, or if something got slower than the threshold allows.
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+root = Path(os.path.abspath(__file__)).parent.parent
+sys.path.insert(0, str(root))
+
+from aoc import runner
+from aoc.common import utils
+
+default_baseline = root / "benchmarks" / "baseline.json"
+whole_run = "(whole run)"
+answer_line = re.compile(r"^(Part ?\d|First answer|Second answer|For example)")
+
+
+def answers(output: str) -> List[str]:
+    lines = [line.rstrip() for line in output.splitlines() if len(line.strip()) > 0]
+    res = [line for line in lines if answer_line.match(line)]
+    return res if len(res) > 0 else lines
+
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    if len(timings) < 2:
+        return {"median_ms": timings[0], "iqr_ms": 0.0}
+    q1, _, q3 = statistics.quantiles(timings, n=4)
+    return {"median_ms": statistics.median(timings), "iqr_ms": q3 - q1}
+
+
+# Returns {"answers": [...], "timings": {function: {"median_ms", "iqr_ms"}}}, or None if the solution failed
+def benchmark(solution: runner.Solution, runs: int, warmup: int) -> Optional[Dict[str, Any]]:
+    timings: Dict[str, List[float]] = {}
+    output = None
+    for i in range(warmup + runs):
+        _, duration, stats, run_output, error = runner.run_solution(solution)
+        if error is not None:
+            print(f"{solution.name} failed:\n{error}")
+            return None
+        output = run_output
+        if i < warmup:
+            continue
+        timings.setdefault(whole_run, []).append(duration)
+        for s in stats:
+            timings.setdefault(s["name"], []).append(s["total_ms"])
+
+    return {"answers": answers(output), "timings": {name: summarize(t) for name, t in timings.items()}}
+
+
+# A timing is a regression if its median is above the baseline one by more than threshold (relative),
+# and by more than the spread (IQR) of both measures, so noisy timings need a bigger change.
+def is_regression(baseline: Dict[str, float], current: Dict[str, float], threshold: float, min_ms: float) -> bool:
+    diff = current["median_ms"] - baseline["median_ms"]
+    return diff > min_ms and diff > threshold * baseline["median_ms"] and diff > baseline["iqr_ms"] + current["iqr_ms"]
+
+
+def compare(name: str, baseline: Dict[str, Any], current: Dict[str, Any], threshold: float, min_ms: float) -> bool:
+    ok = True
+    if baseline["answers"] != current["answers"]:
+        print(f"{name}: ANSWERS CHANGED")
+        print("  baseline:", "\n            ".join(baseline["answers"]))
+        print("  current: ", "\n            ".join(current["answers"]))
+        ok = False
+
+    for function, timing in current["timings"].items():
+        if function not in baseline["timings"]:
+            continue
+        base = baseline["timings"][function]
+        ratio = timing["median_ms"] / base["median_ms"] if base["median_ms"] > 0 else float("inf")
+        regression = is_regression(base, timing, threshold, min_ms)
+        status = "REGRESSION" if regression else ""
+        print(f"{name:<28}{function:<30}{base['median_ms']:>10.1f}ms{timing['median_ms']:>10.1f}ms{ratio:>8.2f}x  {status}")
+        ok = ok and not regression
+
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Regression benchmark of the solutions")
+    parser.add_argument("--event", nargs="*", choices=list(runner.events.keys()), help="Events to run (default: all)")
+    parser.add_argument("--year", nargs="*", type=int, help="Years to run (default: all)")
+    parser.add_argument("--day", nargs="*", type=int, help="Days (or quests) to run (default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="Number of measured runs")
+    parser.add_argument("--warmup", type=int, default=1, help="Number of runs before measuring")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative slow down allowed (0.1 = 10%%)")
+    parser.add_argument("--min-ms", type=float, default=1.0, help="Slow downs under this are ignored")
+    parser.add_argument("--baseline", type=Path, default=default_baseline, help="Baseline file")
+    parser.add_argument("--update", action="store_true", help="Record the results in the baseline instead of comparing")
+    args = parser.parse_args()
+
+    utils.profile_options["quiet"] = True
+    baselines = {}
+    if args.baseline.exists():
+        with args.baseline.open("r") as f:
+            baselines = json.load(f)
+
+    ok = True
+    for solution in runner.discover(args.event, args.year, args.day):
+        current = benchmark(solution, args.runs, args.warmup)
+        if current is None:
+            ok = False
+            continue
+
+        if args.update:
+            baselines[solution.name] = current
+            print(f"{solution.name:<28}{current['timings'][whole_run]['median_ms']:>10.1f}ms")
+        elif solution.name not in baselines:
+            print(f"{solution.name}: no baseline")
+        else:
+            ok = compare(solution.name, baselines[solution.name], current, args.threshold, args.min_ms) and ok
+
+    if args.update:
+        with args.baseline.open("w") as f:
+            json.dump(dict(sorted(baselines.items())), f, indent=4)
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
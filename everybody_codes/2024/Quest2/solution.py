@@ -1,11 +1,11 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all_multiple_parts, default_separator
+from aoc.common.parse_entry import lazy_parse_all_multiple_parts, default_separator
 from aoc.common.utils import profile
 from aoc.common.point import Point
 from aoc.common.grid import Grid
 
-entries, example_entries = parse_all_multiple_parts(__file__, default_separator, 3, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all_multiple_parts(__file__, default_separator, 3, "entry.txt", "example.txt")
 
 def extract_data(entry: List[str], should_split: bool):
     runic_words = entry[0].split(":")[1].split(",")
@@ -41,7 +41,7 @@ def rolling_2D(word_matrix: Grid, runic_word: str, mask: Grid):
     def step(p: Point, dir: Point):
         p += dir
         if not word_matrix.is_valid(p):
-            p.y = (p.y + word_matrix.max_y) % word_matrix.max_y
+            p = p.replace(y=(p.y + word_matrix.max_y) % word_matrix.max_y)
         return p
 
     for i in range(word_matrix.max_x):
@@ -1,10 +1,10 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all_multiple_parts, default_separator
+from aoc.common.parse_entry import lazy_parse_all_multiple_parts, default_separator
 from aoc.common.utils import profile
 from aoc.common.grid import Grid, Point
 
-entries, example_entries = parse_all_multiple_parts(__file__, default_separator, 3, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all_multiple_parts(__file__, default_separator, 3, "entry.txt", "example.txt")
 
 up = Point(-1, 0)
 down = Point(1, 0)
@@ -1,9 +1,9 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all_multiple_parts, default_separator
+from aoc.common.parse_entry import lazy_parse_all_multiple_parts, default_separator
 from aoc.common.utils import profile
 
-entries, example_entries = parse_all_multiple_parts(__file__, default_separator, 3, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all_multiple_parts(__file__, default_separator, 3, "entry.txt", "example.txt")
 
 @profile
 def part_one_and_two(entry: List[str]) -> int:
@@ -1,11 +1,11 @@
 import copy
 from typing import List, Tuple, Dict, Optional, Set
-from aoc.common.parse_entry import parse_all_multiple_parts, default_separator
+from aoc.common.parse_entry import lazy_parse_all_multiple_parts, default_separator
 from aoc.common.utils import profile
 from aoc.common.point import Vector
 import math
 
-entries, example_entries = parse_all_multiple_parts(__file__, default_separator, 3, "entry.txt", "example.txt")
+entries, example_entries = lazy_parse_all_multiple_parts(__file__, default_separator, 3, "entry.txt", "example.txt")
 
 class Complex:
     def __init__(self, x: int, y: int):
@@ -0,0 +1,52 @@
+# Run from the root of the repository: python -m unittest discover tests
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(os.path.abspath(__file__)).parent.parent))
+
+from aoc import runner
+from aoc.common import multithread
+
+# Each script maps a function of its own __main__ in a pool: workers forked for the first one don't know the second one
+scripts = {
+    "Day1": """
+        from aoc.common.multithread import execute_async
+        def double(x): return 2 * x
+        if __name__ == "__main__":
+            print("Part 1 entry:", sum(execute_async(2, double, list(range(10)))))
+    """,
+    "Day2": """
+        from aoc.common.multithread import get_pool
+        def triple(x): return 3 * x
+        if __name__ == "__main__":
+            print("Part 1 entry:", sum(get_pool(2).map(triple, list(range(10)))))
+    """,
+}
+
+
+class RunnerPoolsTest(unittest.TestCase):
+    def test_solutions_using_pools_in_a_row(self):
+        with tempfile.TemporaryDirectory() as folder:
+            solutions = []
+            for day, script in scripts.items():
+                path = Path(folder) / day / "solution.py"
+                path.parent.mkdir()
+                path.write_text(textwrap.dedent(script))
+                solutions.append(runner.Solution("aoc", 0, int(day[3:]), path))
+
+            outputs = []
+            for solution in solutions:
+                _, _, _, output, error = runner.run_solution(solution)
+                self.assertIsNone(error)
+                outputs.append(output)
+
+        self.assertEqual(outputs, ["Part 1 entry: 90\n", "Part 1 entry: 135\n"])
+        self.assertEqual(multithread.pools, {})
+
+
+if __name__ == "__main__":
+    unittest.main()